@@ -39,24 +39,69 @@ Interactive UI usage:
     - On Windows: pip install windows-curses
 '''
 
-from pathlib import Path
-from .traverse import get_paths, FileFilter, scan_directories, add_specific_files
-from .concatenate_files import concat_files, create_file_manifest, FileConcatenator
-from .utils import (
-    is_binary_file, clean_content, write_file, count_tokens,
-    generate_tree, archive_file, configure_logging
+import importlib
+import os
+from functools import lru_cache
 
-)
-from .validation import  ValidationError, ValidationResult
-from .cli import main
+# os.path rather than pathlib keeps `import flort` from loading pathlib (and
+# its urllib/ipaddress imports) before any submodule actually needs it.
+_VERSION_FILE = os.path.join(os.path.dirname(__file__), "VERSION")
 
+# Public API names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562) so that `import flort` and
+# `python -m flort --help` only pay for the modules they actually use.
+_LAZY_IMPORTS = {
+    # traverse
+    'get_paths': 'flort.traverse',
+    'FileFilter': 'flort.traverse',
+    'scan_directories': 'flort.traverse',
+    'add_specific_files': 'flort.traverse',
+    # concatenate_files
+    'concat_files': 'flort.concatenate_files',
+    'create_file_manifest': 'flort.concatenate_files',
+    'FileConcatenator': 'flort.concatenate_files',
+    # utils
+    'is_binary_file': 'flort.utils',
+    'clean_content': 'flort.utils',
+    'write_file': 'flort.utils',
+    'count_tokens': 'flort.utils',
+    'generate_tree': 'flort.utils',
+    'archive_file': 'flort.utils',
+    'configure_logging': 'flort.utils',
+    # validation
+    'ValidationError': 'flort.validation',
+    'ValidationResult': 'flort.validation',
+    # cli
+    'main': 'flort.cli',
+}
 
+
+def __getattr__(name):
+    """Resolve public API names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+@lru_cache(maxsize=1)
 def get_version():
-    """Get version from VERSION file."""
-    version_file = Path(__file__).parent / "VERSION"
-    if version_file.exists():
-        return version_file.read_text().strip()
-    return "2.0.0"
+    """
+    Get version from VERSION file.
+
+    The result is cached so the VERSION file is read at most once per process.
+    """
+    try:
+        with open(_VERSION_FILE, encoding='utf-8') as version_file:
+            return version_file.read().strip()
+    except OSError:
+        return "2.0.0"
 
 __version__ = get_version()
 __author__ = 'Chris Watkins'
@@ -4,9 +4,17 @@ Asset Manager for Flort
 Handles loading and displaying of assets like logos, icons, and ASCII art.
 """
 
+import codecs
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
+
+_MODULE_DIR = Path(__file__).parent
+_PROJECT_ROOT = _MODULE_DIR.parent
+_ASSETS_DIR = _MODULE_DIR / "assets"
+_PROJECT_ASSETS_DIR = _PROJECT_ROOT / "assets"
 
 # ASCII Art (embedded for reliability)
 FLORT_LOGO = """
@@ -29,87 +37,10 @@ F L O R T
 ═════════
 """
 
-def get_asset_path(asset_name: str) -> Optional[Path]:
-    """
-    Get the path to an asset file.
-    
-    Args:
-        asset_name: Name of the asset file (e.g., 'logo.png')
-        
-    Returns:
-        Path to the asset file if it exists, None otherwise
-    """
-    # Try package assets first
-    try:
-        import pkg_resources
-        try:
-            asset_path = pkg_resources.resource_filename('flort', f'assets/{asset_name}')
-            if os.path.exists(asset_path):
-                return Path(asset_path)
-        except (ImportError, FileNotFoundError):
-            pass
-    except ImportError:
-        pass
-    
-    # Try relative to module
-    module_dir = Path(__file__).parent
-    asset_path = module_dir / 'assets' / asset_name
-    if asset_path.exists():
-        return asset_path
-    
-    # Try relative to project root
-    project_root = module_dir.parent
-    asset_path = project_root / 'assets' / asset_name
-    if asset_path.exists():
-        return asset_path
-    
-    return None
+FLORT_TAGLINE = "File Concatenation & Project Overview Tool"
 
-def get_logo_url() -> str:
-    """
-    Get the URL to the Flort logo for online display.
-    
-    Returns:
-        str: URL to the logo image
-    """
-    return "https://raw.githubusercontent.com/chris17453/flort/main/assets/flort-logo.png"
-
-def show_banner(style: str = "full") -> None:
-    """
-    Display a Flort banner.
-    
-    Args:
-        style: Style of banner ("full", "compact", "mini")
-    """
-    if style == "full":
-        print(FLORT_LOGO)
-        print("File Concatenation & Project Overview Tool")
-    elif style == "compact":
-        print(FLORT_COMPACT)
-    elif style == "mini":
-        print(FLORT_MINI)
-    else:
-        print("FLORT - File Concatenation Tool")
-
-def show_ascii_art() -> str:
-    """
-    Get ASCII art for display in help or about sections.
-    
-    Returns:
-        str: ASCII art string
-    """
-    return FLORT_LOGO + "\n\nFile Concatenation & Project Overview Tool\n"
-
-def create_logo_files():
-    """
-    Create logo files for the project.
-    This function creates simple text-based logos that can be converted to images.
-    """
-    assets_dir = Path(__file__).parent.parent / "assets"
-    assets_dir.mkdir(exist_ok=True)
-    
-    # Create a simple SVG logo
-    svg_logo = f"""<?xml version="1.0" encoding="UTF-8"?>
+# Simple SVG logo written by create_logo_files()
+LOGO_SVG = """<?xml version="1.0" encoding="UTF-8"?>
 <svg width="400" height="120" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <linearGradient id="grad1" x1="0%" y1="0%" x2="100%" y2="0%">
@@ -136,12 +67,9 @@ def create_logo_files():
   <line x1="335" y1="30" x2="340" y2="30" stroke="#2196F3" stroke-width="2"/>
   <line x1="355" y1="27" x2="360" y2="27" stroke="#21CBF3" stroke-width="2"/>
 </svg>"""
-    
-    svg_file = assets_dir / "flort-logo.svg"
-    svg_file.write_text(svg_logo)
-    
-    # Create a README for assets
-    readme_content = """# Flort Assets
+
+# README written alongside the generated logo
+ASSETS_README = """# Flort Assets
 
 This directory contains logos, icons, and other visual assets for Flort.
 
@@ -168,9 +96,168 @@ convert flort-logo.svg flort-logo.png
 # Upload SVG to https://convertio.co/svg-png/
 ```
 """
+
+# Pre-joined banner strings so callers don't rebuild them on every render
+_FULL_BANNER = f"{FLORT_LOGO}\n{FLORT_TAGLINE}"
+_ASCII_ART = f"{FLORT_LOGO}\n\n{FLORT_TAGLINE}\n"
+
+# Banner style -> complete text written by show_banner()
+_BANNERS = {
+    "full": f"{_FULL_BANNER}\n",
+    "compact": f"{FLORT_COMPACT}\n",
+    "mini": f"{FLORT_MINI}\n",
+}
+_DEFAULT_BANNER = "FLORT - File Concatenation Tool\n"
+
+# UTF-8 encoded once at import for direct writes to a UTF-8 stdout buffer
+_BANNER_BYTES = {style: text.encode("utf-8") for style, text in _BANNERS.items()}
+_DEFAULT_BANNER_BYTES = _DEFAULT_BANNER.encode("utf-8")
+
+@lru_cache(maxsize=None)
+def _asset_dirs() -> Tuple[Path, ...]:
+    """
+    Get the candidate asset directories in lookup order, without duplicates.
+
+    Package assets come first, then assets relative to the module, then
+    assets relative to the project root.
+    """
+    candidates = []
+    try:
+        from importlib.resources import files
+        package_assets = files('flort') / 'assets'
+    except (ImportError, TypeError):
+        package_assets = None
+    # Only a Traversable that is a real filesystem Path can be scanned and
+    # handed out; zip and other non-filesystem installs use _ASSETS_DIR
+    if isinstance(package_assets, Path):
+        candidates.append(package_assets)
+    candidates.append(_ASSETS_DIR)
+    candidates.append(_PROJECT_ASSETS_DIR)
+    return tuple(dict.fromkeys(candidates))
+
+
+@lru_cache(maxsize=None)
+def _assets_index(assets_dir: Path) -> FrozenSet[str]:
+    """
+    Get the names of all files in an asset directory.
+
+    A single scandir pass replaces one stat call per candidate lookup.
+    """
+    try:
+        with os.scandir(assets_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=128)
+def _find_asset(asset_name: str) -> Optional[Path]:
+    """Look up an asset name against the cached directory indexes."""
+    for assets_dir in _asset_dirs():
+        if asset_name in _assets_index(assets_dir):
+            return assets_dir / asset_name
+    return None
+
+def _clear_asset_caches() -> None:
+    """Forget cached directory listings and lookup results."""
+    _assets_index.cache_clear()
+    _find_asset.cache_clear()
+
+def get_asset_path(asset_name: str, refresh: bool = False) -> Optional[Path]:
+    """
+    Get the path to an asset file.
+    
+    Asset directories are listed once with os.scandir and cached, so lookups
+    after the first never touch the filesystem.
+    
+    Args:
+        asset_name: Name of the asset file (e.g., 'logo.png')
+        refresh: If True, re-scan the asset directories before looking up
+        
+    Returns:
+        Path to the asset file if it exists, None otherwise
+    """
+    if refresh:
+        _clear_asset_caches()
+    return _find_asset(asset_name)
+
+def get_logo_url() -> str:
+    """
+    Get the URL to the Flort logo for online display.
+    
+    Returns:
+        str: URL to the logo image
+    """
+    return "https://raw.githubusercontent.com/chris17453/flort/main/assets/flort-logo.png"
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    """Check whether an encoding name refers to UTF-8."""
+    if not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+def show_banner(style: str = "full") -> None:
+    """
+    Display a Flort banner.
+    
+    Args:
+        style: Style of banner ("full", "compact", "mini")
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None or not _is_utf8(getattr(stdout, "encoding", None)):
+        # Captured or non-UTF-8 streams get text and encode it themselves
+        stdout.write(_BANNERS.get(style, _DEFAULT_BANNER))
+        return
+    
+    # Flush pending text first so the raw bytes land in order
+    stdout.flush()
+    buffer.write(_BANNER_BYTES.get(style, _DEFAULT_BANNER_BYTES))
+    buffer.flush()
+
+def show_ascii_art() -> str:
+    """
+    Get ASCII art for display in help or about sections.
+    
+    Returns:
+        str: ASCII art string
+    """
+    return _ASCII_ART
+
+def _write_if_changed(file_path: Path, content: str) -> bool:
+    """
+    Write content to a file unless it already holds exactly that content.
+
+    Returns:
+        bool: True if the file was written, False if it was left untouched
+    """
+    try:
+        if file_path.read_text() == content:
+            return False
+    except OSError:
+        pass
+    file_path.write_text(content)
+    return True
+
+def create_logo_files():
+    """
+    Create logo files for the project.
+    This function creates simple text-based logos that can be converted to images.
+    """
+    assets_dir = _PROJECT_ASSETS_DIR
+    assets_dir.mkdir(exist_ok=True)
+    
+    svg_file = assets_dir / "flort-logo.svg"
+    _write_if_changed(svg_file, LOGO_SVG)
     
     readme_file = assets_dir / "README.md"
-    readme_file.write_text(readme_content)
+    _write_if_changed(readme_file, ASSETS_README)
+    
+    # New files may have appeared; drop cached directory listings
+    _clear_asset_caches()
     
     print(f"✅ Created logo files in {assets_dir}")
     print(f"📁 SVG logo: {svg_file}")
@@ -180,8 +267,8 @@ convert flort-logo.svg flort-logo.png
     print("   2. Export as PNG (400x120 recommended)")
     print("   3. Save as flort-logo.png")
 
-if __name__ == "__main__":
-    # Demo the assets
+def _run_demo() -> None:
+    """Demo the assets when the module is run as a script."""
     print("🎨 Flort Asset Demo")
     print("=" * 50)
     
@@ -205,4 +292,7 @@ if __name__ == "__main__":
         
         create_files = input("\n❓ Create logo files now? (y/N): ")
         if create_files.lower() in ['y', 'yes']:
-            create_logo_files()
\ No newline at end of file
+            create_logo_files()
+
+if __name__ == "__main__":
+    _run_demo()
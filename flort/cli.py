@@ -22,24 +22,26 @@ Example:
 
 import os
 import argparse
+import functools
 import logging
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .utils import (
     generate_tree, write_file, configure_logging, print_configuration, 
-    count_file_tokens, archive_file, sanitize_output_path,
+    count_file_tokens, archive_file, sanitize_output_path, output_session,
     parse_comma_separated_list, parse_ignore_dirs
 )
-from .traverse import get_paths, add_specific_files
-from .concatenate_files import concat_files, create_file_manifest
-from .python_outline import python_outline_files
 from .validation import validate_arguments
 
+# The discovery and output pipeline modules (traverse, concatenate_files,
+# python_outline) are imported inside main() after argument parsing, so
+# --help, --version and argument errors return without loading them.
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get the package version."""
+    """Get the package version (looked up once per process)."""
     try:
         # Use importlib.metadata (Python 3.8+) or importlib_metadata for older versions
         try:
@@ -51,6 +53,29 @@ def get_version() -> str:
         return "unknown"
 
 
+def default_output_name() -> str:
+    """Get the default output file name, <current_dir>.flort.txt."""
+    return f"{os.path.basename(os.getcwd())}.flort.txt"
+
+
+# Fixed lines at the top of the --show-config block; only the fields vary.
+_CONFIG_HEADER_TEMPLATE = (
+    "## Flort Configuration",
+    "Working Directory: {cwd}",
+    "Output File: {out}",
+    "Target Directories: {dirs}",
+    "",
+)
+
+
+def _emit_section(title: str, items: List[str], lines: List[str]) -> None:
+    """Append a titled bullet list to lines, or nothing if items is empty."""
+    if items:
+        lines.append(title)
+        lines.extend(f"- {item}" for item in items)
+        lines.append("")
+
+
 def generate_config_output(
     directories: List[str],
     extensions: List[str],
@@ -88,11 +113,8 @@ def generate_config_output(
         str: Formatted configuration string
     """
     config_lines = [
-        "## Flort Configuration",
-        f"Working Directory: {Path.cwd()}",
-        f"Output File: {output_path}",
-        f"Target Directories: {', '.join(directories)}",
-        ""
+        line.format(cwd=Path.cwd(), out=output_path, dirs=", ".join(directories))
+        for line in _CONFIG_HEADER_TEMPLATE
     ]
     
     # File inclusion criteria
@@ -106,11 +128,7 @@ def generate_config_output(
     if include_files:
         inclusion_criteria.append(f"Specific files: {', '.join(include_files)}")
     
-    if inclusion_criteria:
-        config_lines.append("### Inclusion Criteria:")
-        for criteria in inclusion_criteria:
-            config_lines.append(f"- {criteria}")
-        config_lines.append("")
+    _emit_section("### Inclusion Criteria:", inclusion_criteria, config_lines)
     
     # File exclusion criteria
     exclusion_criteria = []
@@ -119,17 +137,13 @@ def generate_config_output(
     if exclude_patterns:
         exclusion_criteria.append(f"Patterns: {', '.join(exclude_patterns)}")
     if ignore_dirs:
-        exclusion_criteria.append(f"Directories: {', '.join(str(d) for d in ignore_dirs)}")
+        exclusion_criteria.append(f"Directories: {', '.join(map(str, ignore_dirs))}")
     if not include_binary:
         exclusion_criteria.append("Binary files (use --include-binary to include)")
     if not include_hidden:
         exclusion_criteria.append("Hidden files (use --hidden to include)")
     
-    if exclusion_criteria:
-        config_lines.append("### Exclusion Criteria:")
-        for criteria in exclusion_criteria:
-            config_lines.append(f"- {criteria}")
-        config_lines.append("")
+    _emit_section("### Exclusion Criteria:", exclusion_criteria, config_lines)
     
     # Processing options
     processing_options = []
@@ -139,6 +153,8 @@ def generate_config_output(
         processing_options.append("Content cleaning: enabled")
     else:
         processing_options.append("Content cleaning: disabled")
+    if not other_flags.get('count_tokens', True):
+        processing_options.append("Token counting: disabled")
     
     # Output options
     output_options = []
@@ -162,12 +178,7 @@ def generate_config_output(
     if other_flags.get('archive'):
         output_options.append(f"Archive format: {other_flags['archive']}")
     
-    all_options = processing_options + output_options
-    if all_options:
-        config_lines.append("### Processing Options:")
-        for option in all_options:
-            config_lines.append(f"- {option}")
-        config_lines.append("")
+    _emit_section("### Processing Options:", processing_options + output_options, config_lines)
     
     # Detection summary
     only_include_files = (
@@ -178,19 +189,36 @@ def generate_config_output(
     )
     
     if only_include_files:
-        config_lines.append("### Mode: Specific Files Only")
-        config_lines.append("Directory scanning disabled - only processing specified files")
+        config_lines.extend((
+            "### Mode: Specific Files Only",
+            "Directory scanning disabled - only processing specified files",
+        ))
     else:
-        config_lines.append("### Mode: Directory Scanning")
-        config_lines.append("Scanning directories with applied filters")
+        config_lines.extend((
+            "### Mode: Directory Scanning",
+            "Scanning directories with applied filters",
+        ))
     
-    config_lines.extend(["", "---", ""])
+    config_lines.extend(("", "---", ""))
     
     return "\n".join(config_lines)
 
 
 
 
+class _VersionAction(argparse.Action):
+    """Like argparse's 'version' action, but looks the version up only when used."""
+    
+    def __init__(self, option_strings, dest=argparse.SUPPRESS,
+                 default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"flort {get_version()}")
+        parser.exit()
+
+
 def setup_argument_parser() -> argparse.ArgumentParser:
     """
     Set up and configure the command line argument parser.
@@ -264,8 +292,8 @@ Examples:
     parser.add_argument(
         '-o', '--output', 
         type=str,
-        default=f"{os.path.basename(os.getcwd())}.flort.txt",
-        help='Output file path (default: <current_dir>.flort.txt, "stdio" for console)'
+        default=None,
+        help='Output file path (default: <current_dir>.flort.txt, resolved at run time; "stdio" for console)'
     )
     
     parser.add_argument(
@@ -307,6 +335,12 @@ Examples:
         help='Generate Python class/function outline instead of full source'
     )
     
+    parser.add_argument(
+        '--outline-cache',
+        action='store_true',
+        help='Reuse outlines of unchanged files from ~/.cache/flort across runs'
+    )
+    
     parser.add_argument(
         '-n', '--no-dump', 
         action='store_true',
@@ -339,6 +373,13 @@ Examples:
         help='Do not clean whitespace from file content'
     )
     
+    parser.add_argument(
+        '--no-tokens', 
+        dest='count_tokens',
+        action='store_false',
+        help='Do not count tokens for files or the output'
+    )
+    
     parser.add_argument(
         '--show-config',
         action='store_true',
@@ -361,8 +402,7 @@ Examples:
     
     parser.add_argument(
         '--version', 
-        action='version', 
-        version=f'flort {get_version()}',
+        action=_VersionAction,
         help='Show program version and exit'
     )
 
@@ -405,27 +445,26 @@ def process_ui_integration(args: argparse.Namespace) -> argparse.Namespace:
         # Prepare current settings for UI
         current_extensions = parse_comma_separated_list(args.extensions)
         current_include_files = parse_comma_separated_list(args.include_files)
-        current_ignore_dirs = parse_ignore_dirs(args.ignore_dirs, args.directories)
+        # Ignore dirs stay plain strings through the merge below; they are
+        # only turned back into Paths when args.ignore_dirs is re-parsed
+        current_ignore_dirs = [
+            str(d) for d in parse_ignore_dirs(args.ignore_dirs, args.directories)
+        ]
+        selector_kwargs = {
+            "start_path": args.directories[0] if args.directories else ".",
+            "preselected_filters": [f".{ext}" for ext in current_extensions],
+            "included_files": current_include_files,
+            "ignored_dirs": current_ignore_dirs,
+            "included_dirs": args.directories if args.directories != ["."] else None
+        }
         
         # Launch appropriate UI
         if use_curses:
             from .curses_selector import select_files
-            result = select_files(
-                start_path=args.directories[0] if args.directories else ".",
-                preselected_filters=[f".{ext}" for ext in current_extensions],
-                included_files=current_include_files,
-                ignored_dirs=[str(d) for d in current_ignore_dirs],
-                included_dirs=args.directories if args.directories != ["."] else None
-            )
+            result = select_files(**selector_kwargs)
         else:
             from .simple_selector import simple_select_files
-            result = simple_select_files(
-                start_path=args.directories[0] if args.directories else ".",
-                preselected_filters=[f".{ext}" for ext in current_extensions],
-                included_files=current_include_files,
-                ignored_dirs=[str(d) for d in current_ignore_dirs],
-                included_dirs=args.directories if args.directories != ["."] else None
-            )
+            result = simple_select_files(**selector_kwargs)
         
         if result is None:
             logging.info("UI selection cancelled")
@@ -435,27 +474,20 @@ def process_ui_integration(args: argparse.Namespace) -> argparse.Namespace:
         ui_extensions = [ext.lstrip('.') for ext in result.get("file_types", []) if ext and ext != "*"]
         if ui_extensions:
             existing_extensions = current_extensions
-            combined_extensions = list(set(existing_extensions + ui_extensions))
+            combined_extensions = list(dict.fromkeys(existing_extensions + ui_extensions))
             args.extensions = ','.join(combined_extensions) if combined_extensions else None
         
         # Add UI ignored directories
-        ui_ignored = [Path(p) for p in result.get("ignored", []) if p]
+        ui_ignored = [p for p in result.get("ignored", []) if p]
         if ui_ignored:
-            existing_ignored = current_ignore_dirs
-            combined_ignored = existing_ignored + ui_ignored
-            unique_ignored = []
-            seen = set()
-            for d in combined_ignored:
-                d_str = str(d)
-                if d_str not in seen:
-                    seen.add(d_str)
-                    unique_ignored.append(d)
+            # Dedupe keeping first-seen order
+            unique_ignored = list(dict.fromkeys(current_ignore_dirs + ui_ignored))
             
             if unique_ignored:
-                args.ignore_dirs = ','.join(str(d) for d in unique_ignored)
+                args.ignore_dirs = ','.join(unique_ignored)
         
         # Update directories if UI made selections
-        ui_selected = [p for p in result.get("selected", []) if Path(p).is_dir()]
+        ui_selected = [p for p in result.get("selected", []) if os.path.isdir(p)]
         if ui_selected:
             args.directories = ui_selected
         
@@ -465,7 +497,7 @@ def process_ui_integration(args: argparse.Namespace) -> argparse.Namespace:
         print("\n❌ UI cancelled by user")
         sys.exit(0)
     except Exception as e:
-        logging.error(f"Error in UI integration: {e}")
+        logging.error("Error in UI integration: %s", e)
         print(f"❌ UI failed to start: {e}")
         print("📝 Continuing without interactive mode...")
         args.ui = False  # Disable UI and continue
@@ -484,32 +516,58 @@ def exclude_output_file(path_list: List[dict], output_path: str) -> List[dict]:
     Returns:
         list: Updated path list with output file excluded
     """
-    if output_path == "stdio":
+    if output_path == "stdio" or not path_list:
         return path_list
     
+    return _prepare_entries(path_list, output_path)[0]
+
+
+def _prepare_entries(path_list: List[dict], output_path: str) -> Tuple[List[dict], int, int]:
+    """
+    Exclude the output file and count files and directories in one pass.
+    
+    Args:
+        path_list: List of path dictionaries
+        output_path: Output file path
+        
+    Returns:
+        tuple: (filtered path list, file count, directory count)
+    """
+    filtered_list = []
+    file_count = 0
+    dir_count = 0
     try:
-        output_resolved = sanitize_output_path(output_path)
-        original_count = len(path_list)
+        output_name = None
+        if output_path != "stdio" and path_list:
+            # Resolve the output path once; only items sharing its basename can
+            # possibly be the output file, so only those get resolved themselves.
+            # os.path.realpath() does not raise for missing or dangling paths.
+            output_real = os.path.realpath(sanitize_output_path(output_path))
+            output_name = os.path.basename(output_real)
         
-        filtered_list = []
         for item in path_list:
-            try:
-                item_resolved = item["path"].resolve()
-                if item_resolved != output_resolved:
-                    filtered_list.append(item)
-            except Exception as e:
-                logging.debug(f"Error resolving path {item['path']}: {e}")
-                filtered_list.append(item)  # Include if we can't resolve
-        
-        excluded_count = original_count - len(filtered_list)
-        if excluded_count > 0:
-            logging.info(f"Excluded {excluded_count} output file(s) from processing")
-        
-        return filtered_list
-        
+            if output_name is not None:
+                item_path = os.fspath(item["path"])
+                if (os.path.basename(item_path) == output_name and
+                        os.path.realpath(item_path) == output_real):
+                    continue
+            
+            item_type = item['type']
+            if item_type == 'file':
+                file_count += 1
+            elif item_type == 'dir':
+                dir_count += 1
+            filtered_list.append(item)
     except Exception as e:
-        logging.error(f"Error excluding output file: {e}")
-        return path_list
+        # Fall back to counting everything without excluding anything
+        logging.error("Error excluding output file: %s", e)
+        return _prepare_entries(path_list, "stdio")
+    
+    excluded_count = len(path_list) - len(filtered_list)
+    if excluded_count > 0:
+        logging.info("Excluded %d output file(s) from processing", excluded_count)
+    
+    return filtered_list, file_count, dir_count
 
 
 def main() -> None:
@@ -531,9 +589,21 @@ def main() -> None:
     Raises:
         SystemExit: If arguments are invalid or critical errors occur
     """
+    # A bare --version does not need the full parser
+    if sys.argv[1:] == ['--version']:
+        print(f"flort {get_version()}")
+        return
+
     # Parse arguments
     parser = setup_argument_parser()
     args = parser.parse_args()
+    if args.output is None:
+        args.output = default_output_name()
+    
+    from datetime import datetime
+    from .traverse import get_paths, add_specific_files
+    from .concatenate_files import concat_files, create_file_manifest
+    from .python_outline import python_outline_files
     
     # Configure logging early
     configure_logging(args.verbose)
@@ -565,11 +635,12 @@ def main() -> None:
         validation_result = validate_arguments(args)
         if not validation_result.is_valid:
             error_message = validation_result.get_error_message()
-            logging.error(f"Invalid configuration after UI integration: {error_message}")
+            logging.error("Invalid configuration after UI integration: %s", error_message)
             sys.exit(1)
     # Sanitize output path
     output_path = sanitize_output_path(args.output)
-    output_str = str(output_path) if output_path.name != "stdio" else "stdio"
+    is_stdio = output_path.name == "stdio"
+    output_str = "stdio" if is_stdio else os.fspath(output_path)
     
     # Log configuration
     print_configuration(
@@ -584,128 +655,133 @@ def main() -> None:
         glob_patterns=include_patterns
     )
     
-    # Initialize output file with timestamp
-    current_datetime = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    if not write_file(output_str, f"## Florted: {current_datetime}\n", 'w'):
-        logging.error(f"Failed to initialize output file: {output_str}")
-        sys.exit(1)
-    
-    # Add configuration output if requested
-    if args.show_config:
-        config_output = generate_config_output(
-            directories=directories,
-            extensions=extensions,
-            exclude_extensions=exclude_extensions,
-            include_patterns=include_patterns,
-            exclude_patterns=exclude_patterns,
-            include_files=include_files,
-            ignore_dirs=ignore_dirs,
-            include_all=args.all,
-            include_hidden=args.hidden,
-            include_binary=args.include_binary,
-            max_depth=args.max_depth,
-            output_path=output_str,
-            other_flags={
-                'clean_content': args.clean_content,
-                'no_tree': args.no_tree,
-                'outline': args.outline,
-                'no_dump': args.no_dump,
-                'manifest': args.manifest,
-                'archive': args.archive
-            }
-        )
-        if not write_file(output_str, config_output):
-            logging.error("Failed to write configuration output")
-            sys.exit(1)
-    
-    # Get file paths using the comprehensive discovery system
-    logging.info("Starting file discovery...")
-    
-    try:
-        # If only include_files is specified (no extensions, no --all, no glob), 
-        # then ONLY process those files
-        only_include_files = (
-            include_files and 
-            not extensions and 
-            not args.all and 
-            not include_patterns and
-            not args.glob
-        )
-        
-        if only_include_files:
-            logging.info("Only processing specifically included files (no directory scanning)")
-            base_dir = Path(directories[0]).resolve() if directories else Path.cwd()
-            path_list = add_specific_files(path_list, include_files, base_dir)
-        else:
-            path_list = get_paths(
+    # Keep the output file open across all sections; it is closed before
+    # the statistics pass below reads it back
+    with output_session(output_str):
+        # Initialize output file with timestamp and, if requested, the
+        # configuration, in a single write
+        current_datetime = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        initial_output = f"## Florted: {current_datetime}\n"
+        if args.show_config:
+            initial_output += generate_config_output(
                 directories=directories,
                 extensions=extensions,
                 exclude_extensions=exclude_extensions,
                 include_patterns=include_patterns,
                 exclude_patterns=exclude_patterns,
+                include_files=include_files,
+                ignore_dirs=ignore_dirs,
                 include_all=args.all,
                 include_hidden=args.hidden,
                 include_binary=args.include_binary,
-                ignore_dirs=ignore_dirs,
-                include_files=include_files,
-                glob_patterns=include_patterns,  # Same as include_patterns for compatibility
-                max_depth=args.max_depth
+                max_depth=args.max_depth,
+                output_path=output_str,
+                other_flags={
+                    'clean_content': args.clean_content,
+                    'count_tokens': args.count_tokens,
+                    'no_tree': args.no_tree,
+                    'outline': args.outline,
+                    'no_dump': args.no_dump,
+                    'manifest': args.manifest,
+                    'archive': args.archive
+                }
             )
-    except Exception as e:
-        logging.error(f"Error during file discovery: {e}")
-        sys.exit(1)
-    
-    # Exclude output file from processing
-    path_list = exclude_output_file(path_list, output_str)
+        if not write_file(output_str, initial_output, 'w'):
+            logging.error("Failed to initialize output file: %s", output_str)
+            sys.exit(1)
     
-    # Count results
-    file_count = len([item for item in path_list if item['type'] == 'file'])
-    dir_count = len([item for item in path_list if item['type'] == 'dir'])
+        # Get file paths using the comprehensive discovery system
+        logging.info("Starting file discovery...")
     
-    if file_count == 0:
-        logging.warning("No files found matching criteria")
-        if not write_file(output_str, "## No files found matching criteria\n"):
+        try:
+            # If only include_files is specified (no extensions, no --all, no glob), 
+            # then ONLY process those files
+            only_include_files = (
+                include_files and 
+                not extensions and 
+                not args.all and 
+                not include_patterns and
+                not args.glob
+            )
+        
+            if only_include_files:
+                logging.info("Only processing specifically included files (no directory scanning)")
+                base_dir = Path(directories[0]).resolve() if directories else Path.cwd()
+                path_list = add_specific_files(path_list, include_files, base_dir)
+            else:
+                path_list = get_paths(
+                    directories=directories,
+                    extensions=extensions,
+                    exclude_extensions=exclude_extensions,
+                    include_patterns=include_patterns,
+                    exclude_patterns=exclude_patterns,
+                    include_all=args.all,
+                    include_hidden=args.hidden,
+                    include_binary=args.include_binary,
+                    ignore_dirs=ignore_dirs,
+                    include_files=include_files,
+                    glob_patterns=include_patterns,  # Same as include_patterns for compatibility
+                    max_depth=args.max_depth
+                )
+        except Exception as e:
+            logging.error("Error during file discovery: %s", e)
             sys.exit(1)
-        print("No files found matching the specified criteria.")
-        return
     
-    print(f"Processing {file_count} files from {dir_count} directories -> {output_str}")
+        # Exclude output file from processing and count results in one pass
+        path_list, file_count, dir_count = _prepare_entries(path_list, output_str)
     
-    try:
-        # Generate directory tree if not disabled
-        if not args.no_tree:
-            logging.info("Generating directory tree...")
-            if not generate_tree(path_list, output_str):
-                logging.error("Failed to generate directory tree")
+        if file_count == 0:
+            logging.warning("No files found matching criteria")
+            if not write_file(output_str, "## No files found matching criteria\n"):
                 sys.exit(1)
+            print("No files found matching the specified criteria.")
+            return
+    
+        print(f"Processing {file_count} files from {dir_count} directories -> {output_str}")
+    
+        try:
+            # Generate directory tree if not disabled
+            if not args.no_tree:
+                logging.info("Generating directory tree...")
+                if not generate_tree(path_list, output_str):
+                    logging.error("Failed to generate directory tree")
+                    sys.exit(1)
         
-        # Generate Python outline if requested
-        if args.outline:
-            logging.info("Generating Python outline...")
-            if not python_outline_files(path_list, output_str):
-                logging.error("Failed to generate Python outline")
-                sys.exit(1)
+            # Generate Python outline if requested
+            if args.outline:
+                logging.info("Generating Python outline...")
+                if not python_outline_files(path_list, output_str, args.outline_cache):
+                    logging.error("Failed to generate Python outline")
+                    sys.exit(1)
         
-        # Generate file manifest or concatenate files
-        if args.manifest:
-            logging.info("Generating file manifest...")
-            if not create_file_manifest(path_list, output_str):
-                logging.error("Failed to create file manifest")
-                sys.exit(1)
-        elif not args.no_dump:
-            logging.info("Concatenating files...")
-            if not concat_files(path_list, output_str, args.clean_content):
-                logging.error("Failed to concatenate files")
-                sys.exit(1)
+            # Generate file manifest or concatenate files
+            if args.manifest:
+                logging.info("Generating file manifest...")
+                if not create_file_manifest(path_list, output_str):
+                    logging.error("Failed to create file manifest")
+                    sys.exit(1)
+            elif not args.no_dump:
+                logging.info("Concatenating files...")
+                if not concat_files(path_list, output_str, args.clean_content, args.count_tokens):
+                    logging.error("Failed to concatenate files")
+                    sys.exit(1)
         
+        except KeyboardInterrupt:
+            logging.info("Operation cancelled by user")
+            sys.exit(1)
+        except Exception as e:
+            logging.error("Unexpected error during processing: %s", e)
+            sys.exit(1)
+    
+    try:
         # Show token count and statistics
-        if output_str != "stdio":
+        if not is_stdio and args.count_tokens:
             token_info = count_file_tokens(output_str)
             print(f"\nOutput Statistics:\n{token_info}")
         
         # Archive the output file if requested
-        if args.archive and output_str != "stdio":
-            logging.info(f"Creating {args.archive} archive...")
+        if args.archive and not is_stdio:
+            logging.info("Creating %s archive...", args.archive)
             archive_path = archive_file(output_str, args.archive)
             if archive_path:
                 print(f"Archive created: {archive_path}")
@@ -718,7 +794,7 @@ def main() -> None:
         logging.info("Operation cancelled by user")
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Unexpected error during processing: {e}")
+        logging.error("Unexpected error during processing: %s", e)
         sys.exit(1)
 
 
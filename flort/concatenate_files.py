@@ -6,6 +6,7 @@ with proper formatting, error handling, and metadata tracking.
 
 Features:
 - Safe file reading with encoding detection
+- Files read ahead on worker threads while output is written in order
 - Content cleaning and formatting
 - Token and character counting
 - Progress tracking for large operations
@@ -13,11 +14,29 @@ Features:
 """
 
 import logging
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
+from itertools import islice
 
-from .utils import write_file, count_tokens, clean_content, is_binary_file
+from .utils import write_file, output_session, count_tokens, clean_text, is_binary_file
+
+# Buffered output is flushed to write_file once it reaches this many characters
+FLUSH_THRESHOLD = 4 * 1024 * 1024
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Maximum number of files read ahead of the writer by worker threads
+PREFETCH_LIMIT = 64
+
+# Result of FileConcatenator._prepare_file:
+# (content or None, token count, error entry text or None, summary error messages)
+PreparedFile = Tuple[Optional[str], int, Optional[str], List[str]]
 
 
 class FileConcatenator:
@@ -26,16 +45,19 @@ class FileConcatenator:
     and progress tracking.
     """
     
-    def __init__(self, output_path: str, clean_content_flag: bool = True):
+    def __init__(self, output_path: str, clean_content_flag: bool = True,
+                 count_tokens_flag: bool = True):
         """
         Initialize the file concatenator.
         
         Args:
             output_path: Path to write concatenated output
             clean_content_flag: Whether to clean whitespace from content
+            count_tokens_flag: Whether to count tokens for each file
         """
         self.output_path = output_path
         self.clean_content_flag = clean_content_flag
+        self.count_tokens_flag = count_tokens_flag
         self.stats = {
             "files_processed": 0,
             "files_skipped": 0,
@@ -43,6 +65,12 @@ class FileConcatenator:
             "total_tokens": 0,
             "errors": []
         }
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        # Cleaning is fixed per instance, so pick the content step once
+        self._prepare_content = (
+            self._clean_file_content if clean_content_flag else self._raw_file_content
+        )
     
     def concatenate_files(self, file_list: List[Dict[str, Any]]) -> bool:
         """
@@ -65,69 +93,167 @@ class FileConcatenator:
             logging.warning("No files found in file list")
             return write_file(self.output_path, "## File Data\n(No files found)\n\n")
         
-        logging.info(f"Starting concatenation of {len(files_to_process)} files")
-        
-        # Write header
-        if not write_file(self.output_path, "## File Data\n"):
-            return False
+        total_files = len(files_to_process)
+        logging.info("Starting concatenation of %d files", total_files)
         
-        # Process each file
-        for i, item in enumerate(files_to_process, 1):
-            file_path = item["path"]
-            relative_path = item["relative_path"]
+        # Keep the output open across flushes (a no-op inside an existing session)
+        with output_session(self.output_path, mode='a'):
+            # Write header
+            if not self._append("## File Data\n"):
+                return False
             
-            logging.debug(f"Processing file {i}/{len(files_to_process)}: {relative_path}")
+            # Process each file: worker threads read, clean and count ahead,
+            # output is written here in list order
+            with ThreadPoolExecutor() as executor:
+                prepared_files = self._prepare_files(executor, files_to_process)
+                for i, (item, prepared) in enumerate(zip(files_to_process, prepared_files), 1):
+                    relative_path = item["relative_path"]
+                    
+                    logging.debug("Processing file %d/%d: %s", i, total_files, relative_path)
+                    
+                    success = self._emit_file(relative_path, prepared)
+                    
+                    if success:
+                        self.stats["files_processed"] += 1
+                    else:
+                        self.stats["files_skipped"] += 1
+                    
+                    # Log progress for large operations
+                    if i % 10 == 0 or i == total_files:
+                        logging.info("Progress: %d/%d files processed", i, total_files)
+            
+            # Write summary
+            self._write_summary()
             
-            success = self._process_single_file(file_path, relative_path)
+            logging.info("Concatenation complete. Processed: %d, Skipped: %d",
+                         self.stats['files_processed'], self.stats['files_skipped'])
             
-            if success:
-                self.stats["files_processed"] += 1
-            else:
-                self.stats["files_skipped"] += 1
+            return self._flush()
+    
+    def _append(self, data: str) -> bool:
+        """
+        Buffer output, flushing once FLUSH_THRESHOLD characters are pending.
+        
+        Args:
+            data: Content to write
             
-            # Log progress for large operations
-            if i % 10 == 0 or i == len(files_to_process):
-                logging.info(f"Progress: {i}/{len(files_to_process)} files processed")
+        Returns:
+            bool: False if a flush was needed and failed
+        """
+        if len(data) >= FLUSH_THRESHOLD:
+            # Large file contents go straight out rather than being copied
+            # into the joined buffer first
+            return self._flush() and write_file(self.output_path, data)
+        
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        if self._buffer_size >= FLUSH_THRESHOLD:
+            return self._flush()
+        return True
+    
+    def _flush(self) -> bool:
+        """
+        Write all buffered output with a single write_file call.
         
-        # Write summary
-        self._write_summary()
+        Returns:
+            bool: True if the buffer was written (or was empty)
+        """
+        if not self._buffer:
+            return True
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_size = 0
+        return write_file(self.output_path, data)
+    
+    def _prepare_files(self, executor: Executor,
+                       files: List[Dict[str, Any]]) -> Iterator[PreparedFile]:
+        """
+        Prepare files on an executor, yielding results in input order.
         
-        logging.info(f"Concatenation complete. Processed: {self.stats['files_processed']}, "
-                    f"Skipped: {self.stats['files_skipped']}")
+        At most PREFETCH_LIMIT files are in flight, which bounds the amount of
+        file content held in memory ahead of the writer.
         
-        return True
+        Args:
+            executor: Executor to run _prepare_file on
+            files: File dictionaries to prepare
+            
+        Yields:
+            PreparedFile: Result of _prepare_file for each file, in order
+        """
+        pending = deque()
+        for item in files:
+            pending.append(executor.submit(
+                self._prepare_file, item["path"], item["relative_path"], item.get("is_binary")
+            ))
+            if len(pending) >= PREFETCH_LIMIT:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
     
-    def _process_single_file(self, file_path: Path, relative_path: str) -> bool:
+    def _prepare_file(self, file_path: Path, relative_path: str,
+                      is_binary: Optional[bool] = None) -> PreparedFile:
         """
-        Process a single file for concatenation.
+        Read, clean and count a single file without writing any output.
+        
+        Safe to run in a worker thread: statistics are left to _emit_file.
         
         Args:
             file_path: Path to the file to process
             relative_path: Relative path for display
+            is_binary: Binary check already done during discovery, if any
             
         Returns:
-            bool: True if file was processed successfully
+            PreparedFile: (content, token count, error entry, error messages)
         """
+        errors = []
         try:
-            # Double-check that it's not a binary file
-            if is_binary_file(file_path):
-                logging.warning(f"Skipping binary file: {relative_path}")
-                error_msg = f"Binary file skipped: {relative_path}"
-                self.stats["errors"].append(error_msg)
-                return self._write_file_error(relative_path, "Binary file")
+            # Double-check that it's not a binary file, unless discovery did
+            if is_binary is None:
+                is_binary = is_binary_file(file_path)
+            if is_binary:
+                logging.warning("Skipping binary file: %s", relative_path)
+                errors.append(f"Binary file skipped: {relative_path}")
+                return None, 0, "Binary file", errors
             
             # Read file content
-            content = self._read_file_safely(file_path)
+            content = self._read_file_safely(file_path, errors)
             if content is None:
-                return False
+                return None, 0, None, errors
             
             # Clean content if requested
-            if self.clean_content_flag:
-                content = self._clean_file_content(file_path, content)
+            content = self._prepare_content(file_path, content)
+            
+            token_count = count_tokens(content) if self.count_tokens_flag else 0
+            return content, token_count, None, errors
+            
+        except Exception as e:
+            error_msg = f"Error processing {relative_path}: {str(e)}"
+            logging.error(error_msg)
+            errors.append(error_msg)
+            return None, 0, str(e), errors
+    
+    def _emit_file(self, relative_path: str, prepared: PreparedFile) -> bool:
+        """
+        Write a prepared file to the output and update statistics.
+        
+        Args:
+            relative_path: Relative path for display
+            prepared: Result of _prepare_file for this file
+            
+        Returns:
+            bool: True if file was processed successfully
+        """
+        content, token_count, error_entry, errors = prepared
+        self.stats["errors"].extend(errors)
+        
+        try:
+            if content is None:
+                if error_entry is None:
+                    return False
+                return self._write_file_error(relative_path, error_entry)
             
             # Calculate metrics
             char_count = len(content)
-            token_count = count_tokens(content)
             
             # Update statistics
             self.stats["total_characters"] += char_count
@@ -138,11 +264,11 @@ class FileConcatenator:
                 return False
             
             # Write file content
-            if not write_file(self.output_path, content):
+            if not self._append(content):
                 return False
             
             # Add separator
-            if not write_file(self.output_path, "\n\n"):
+            if not self._append("\n\n"):
                 return False
             
             return True
@@ -153,45 +279,40 @@ class FileConcatenator:
             self.stats["errors"].append(error_msg)
             return self._write_file_error(relative_path, str(e))
     
-    def _read_file_safely(self, file_path: Path) -> Optional[str]:
+    def _read_file_safely(self, file_path: Path,
+                          errors: Optional[List[str]] = None) -> Optional[str]:
         """
-        Safely read a file with multiple encoding attempts.
+        Safely read a file as UTF-8, replacing undecodable bytes.
         
         Args:
             file_path: Path to the file to read
+            errors: List to record a read failure in (defaults to the statistics)
             
         Returns:
             str: File content, or None if reading failed
         """
-        encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-        
-        for encoding in encodings_to_try:
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                    content = f.read()
-                    
-                # Validate that we got reasonable content
-                if content or file_path.stat().st_size == 0:  # Allow empty files
-                    logging.debug(f"Successfully read {file_path} with encoding {encoding}")
-                    return content
-                    
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                logging.error(f"Error reading {file_path} with {encoding}: {e}")
-                continue
-        
-        # If all encodings failed, try binary read with replacement
+        # With errors='replace' decoding cannot fail, so one read is enough;
+        # only I/O errors can get in the way
         try:
             with open(file_path, 'rb') as f:
-                raw_content = f.read()
-                content = raw_content.decode('utf-8', errors='replace')
-                logging.warning(f"Used binary read with replacement for {file_path}")
-                return content
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    # Decode from the page cache instead of copying into bytes first
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mapped, 'madvise'):
+                            # Decoding reads front to back; let the kernel read ahead
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        content = str(mapped, 'utf-8', 'replace')
+                else:
+                    content = f.read().decode('utf-8', errors='replace')
+            
+            # Same newline translation as reading in text mode
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+            logging.debug("Successfully read %s with encoding utf-8", file_path)
+            return content
         except Exception as e:
-            error_msg = f"Failed to read {file_path} with any encoding: {e}"
+            error_msg = f"Failed to read {file_path}: {e}"
             logging.error(error_msg)
-            self.stats["errors"].append(error_msg)
+            (self.stats["errors"] if errors is None else errors).append(error_msg)
             return None
     
     def _clean_file_content(self, file_path: Path, content: str) -> str:
@@ -206,11 +327,24 @@ class FileConcatenator:
             str: Cleaned content
         """
         try:
-            return clean_content(file_path)
+            return clean_text(content)
         except Exception as e:
-            logging.warning(f"Content cleaning failed for {file_path}: {e}, using raw content")
+            logging.warning("Content cleaning failed for %s: %s, using raw content", file_path, e)
             return content
     
+    def _raw_file_content(self, file_path: Path, content: str) -> str:
+        """
+        Return file content unchanged (used when cleaning is disabled).
+        
+        Args:
+            file_path: Path to the file (unused, matches _clean_file_content)
+            content: Raw file content
+            
+        Returns:
+            str: The same content
+        """
+        return content
+    
     def _write_file_header(self, relative_path: str, char_count: int, token_count: int) -> bool:
         """
         Write the header information for a file.
@@ -223,11 +357,15 @@ class FileConcatenator:
         Returns:
             bool: True if header was written successfully
         """
-        header = f"--- File: {relative_path}\n"
-        header += f"--- Characters: {char_count:,}\n"
-        header += f"--- Token Count: {token_count:,}\n"
-        
-        return write_file(self.output_path, header)
+        return self._append(
+            f"--- File: {relative_path}\n"
+            f"--- Characters: {char_count:,}\n"
+            f"--- Token Count: {self._format_tokens(token_count)}\n"
+        )
+    
+    def _format_tokens(self, token_count: int) -> str:
+        """Format a token count, or mark it disabled when counting is off."""
+        return f"{token_count:,}" if self.count_tokens_flag else "(disabled)"
     
     def _write_file_error(self, relative_path: str, error_message: str) -> bool:
         """
@@ -240,11 +378,11 @@ class FileConcatenator:
         Returns:
             bool: True if error entry was written successfully
         """
-        error_content = f"--- File: {relative_path}\n"
-        error_content += f"--- Error: {error_message}\n"
-        error_content += "--- Content: <Unable to read file>\n\n"
-        
-        return write_file(self.output_path, error_content)
+        return self._append(
+            f"--- File: {relative_path}\n"
+            f"--- Error: {error_message}\n"
+            "--- Content: <Unable to read file>\n\n"
+        )
     
     def _write_summary(self) -> bool:
         """
@@ -253,22 +391,25 @@ class FileConcatenator:
         Returns:
             bool: True if summary was written successfully
         """
-        summary = "\n## Concatenation Summary\n"
-        summary += f"Files processed: {self.stats['files_processed']}\n"
-        summary += f"Files skipped: {self.stats['files_skipped']}\n"
-        summary += f"Total characters: {self.stats['total_characters']:,}\n"
-        summary += f"Total tokens: {self.stats['total_tokens']:,}\n"
-        
-        if self.stats["errors"]:
-            summary += f"\n### Errors ({len(self.stats['errors'])}):\n"
-            for error in self.stats["errors"][:10]:  # Limit to first 10 errors
-                summary += f"- {error}\n"
-            if len(self.stats["errors"]) > 10:
-                summary += f"... and {len(self.stats['errors']) - 10} more errors\n"
-        
-        summary += f"\nCompleted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return write_file(self.output_path, summary)
+        summary = [
+            "\n## Concatenation Summary\n"
+            f"Files processed: {self.stats['files_processed']}\n"
+            f"Files skipped: {self.stats['files_skipped']}\n"
+            f"Total characters: {self.stats['total_characters']:,}\n"
+            f"Total tokens: {self._format_tokens(self.stats['total_tokens'])}\n"
+        ]
+        
+        error_count = len(self.stats["errors"])
+        if error_count:
+            summary.append(f"\n### Errors ({error_count}):\n")
+            # Limit to first 10 errors
+            summary.extend(f"- {error}\n" for error in islice(self.stats["errors"], 10))
+            if error_count > 10:
+                summary.append(f"... and {error_count - 10} more errors\n")
+        
+        summary.append(f"\nCompleted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        return self._append("".join(summary))
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -280,7 +421,8 @@ class FileConcatenator:
         return self.stats.copy()
 
 
-def concat_files(file_list: List[Dict[str, Any]], output: str, clean_content: bool = True) -> bool:
+def concat_files(file_list: List[Dict[str, Any]], output: str, clean_content: bool = True,
+                 count_tokens: bool = True) -> bool:
     """
     Concatenate files from a file list into a single output.
     
@@ -291,6 +433,7 @@ def concat_files(file_list: List[Dict[str, Any]], output: str, clean_content: bo
         file_list: List of file dictionaries with path and metadata information
         output: Output file path or "stdio" for console output
         clean_content: Whether to clean whitespace from file content
+        count_tokens: Whether to count tokens for each file
         
     Returns:
         bool: True if concatenation was successful, False otherwise
@@ -307,18 +450,18 @@ def concat_files(file_list: List[Dict[str, Any]], output: str, clean_content: bo
         return False
     
     try:
-        concatenator = FileConcatenator(output, clean_content)
+        concatenator = FileConcatenator(output, clean_content, count_tokens)
         success = concatenator.concatenate_files(file_list)
         
         # Log final statistics
         stats = concatenator.get_statistics()
         if stats["files_processed"] > 0:
-            logging.info(f"Concatenation statistics: {stats}")
+            logging.info("Concatenation statistics: %s", stats)
         
         return success
         
     except Exception as e:
-        logging.error(f"Error in concat_files: {e}")
+        logging.error("Error in concat_files: %s", e)
         return False
 
 
@@ -338,14 +481,13 @@ def create_file_manifest(file_list: List[Dict[str, Any]], output: str) -> bool:
         bool: True if manifest was created successfully
     """
     try:
-        if not write_file(output, "## File Manifest\n"):
-            return False
-        
         files_only = [item for item in file_list if item.get("type") == "file"]
         
         if not files_only:
-            return write_file(output, "(No files found)\n\n")
+            return write_file(output, "## File Manifest\n(No files found)\n\n")
         
+        # Collect the whole manifest and write it once
+        lines = ["## File Manifest\n"]
         total_size = 0
         total_files = len(files_only)
         
@@ -357,24 +499,21 @@ def create_file_manifest(file_list: List[Dict[str, Any]], output: str) -> bool:
                 size = file_path.stat().st_size
                 total_size += size
                 
-                # Determine if binary
-                is_binary = is_binary_file(file_path)
+                # Determine if binary, reusing the discovery-time check
+                is_binary = item.get("is_binary")
+                if is_binary is None:
+                    is_binary = is_binary_file(file_path)
                 binary_indicator = " [BINARY]" if is_binary else ""
                 
-                manifest_line = f"{i:3d}. {relative_path} ({size:,} bytes){binary_indicator}\n"
-                
-                if not write_file(output, manifest_line):
-                    return False
+                lines.append(f"{i:3d}. {relative_path} ({size:,} bytes){binary_indicator}\n")
                     
             except Exception as e:
-                error_line = f"{i:3d}. {relative_path} (ERROR: {e})\n"
-                if not write_file(output, error_line):
-                    return False
+                lines.append(f"{i:3d}. {relative_path} (ERROR: {e})\n")
         
-        # Write summary
-        summary = f"\nTotal: {total_files} files, {total_size:,} bytes\n\n"
-        return write_file(output, summary)
+        # Summary
+        lines.append(f"\nTotal: {total_files} files, {total_size:,} bytes\n\n")
+        return write_file(output, "".join(lines))
         
     except Exception as e:
-        logging.error(f"Error creating file manifest: {e}")
-        return False
\ No newline at end of file
+        logging.error("Error creating file manifest: %s", e)
+        return False
@@ -1,8 +1,83 @@
 import os
+import stat
+import sys
 import curses
 import curses.textpad
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+HELP_LINES = [
+    "🎯 NAVIGATION:",
+    "  ↑/↓/PgUp/PgDn: Navigate    SPACE: Toggle selection",
+    "  ←/→/Enter: Directories    TAB: File type manager",
+    "  i: Ignore item/dir        v: View selections",
+    "🖱️  MOUSE: Click to select, scroll to navigate",
+    "📝 FILTERING:",
+    "  f: Edit file types        a: Select all visible",
+    "  c: Clear all selections   r: Reset to discovered types",
+    "⚡ ACTIONS:",
+    "  q: Done with selection    ESC: Cancel",
+    "  h: Toggle this help       A: ASCII glyphs"
+]
+
+# Checkbox state of a path: bit 0 = selected, bit 1 = ignored
+_SELECTED = 1
+_IGNORED = 2
+
+# Row glyphs: (directory icon, file icon, inaccessible icon, marks by state)
+_UNICODE_GLYPHS = ("📁", "📄", "🚫", (' ', '✓', '✗', '✓'))
+_ASCII_GLYPHS = ("D", "F", "X", (' ', '*', '-', '*'))
+
+def _ascii_terminal():
+    """True when the terminal is unlikely to render emoji cheaply, or at all."""
+    encoding = getattr(sys.stdout, "encoding", None) or ""
+    return os.environ.get("TERM") == "dumb" or "utf" not in encoding.lower()
+
+def _state(path, selection, ignored):
+    return (path in selection) | ((path in ignored) << 1)
+
+# Background listing of the directory under the cursor, created on first use
+# and shut down by select_files when the session ends
+_prefetch_pool = None
+
+def _prefetch(path, file_types, selection):
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = ThreadPoolExecutor(max_workers=2)
+    return _prefetch_pool.submit(get_directory_contents, path, file_types, selection)
+
+def _shutdown_prefetch():
+    """Stop the prefetch workers, dropping listings nobody will read."""
+    global _prefetch_pool
+    pool, _prefetch_pool = _prefetch_pool, None
+    if pool is None:
+        return
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        pool.shutdown(wait=False)
+
+# Display attributes, composed once by _init_colors after curses starts
+_ATTR_CURSOR = _ATTR_NORMAL = _ATTR_INACCESSIBLE = _ATTR_INCLUDED = 0
+_ATTR_HEADER = _ATTR_STATUS = _ATTR_DIR = 0
+
+def _init_colors():
+    global _ATTR_CURSOR, _ATTR_NORMAL, _ATTR_INACCESSIBLE, _ATTR_INCLUDED
+    global _ATTR_HEADER, _ATTR_STATUS, _ATTR_DIR
+    curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Selected
+    curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Normal
+    curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)    # Inaccessible
+    curses.init_pair(4, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Included
+    curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Header
+    curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)   # Directory
+    _ATTR_CURSOR = curses.color_pair(1) | curses.A_BOLD
+    _ATTR_NORMAL = curses.color_pair(2)
+    _ATTR_INACCESSIBLE = curses.color_pair(3) | curses.A_DIM
+    _ATTR_INCLUDED = curses.color_pair(4)
+    _ATTR_HEADER = curses.color_pair(5) | curses.A_BOLD
+    _ATTR_STATUS = curses.color_pair(5)
+    _ATTR_DIR = curses.color_pair(6)
 
 def is_accessible(path):
     try:
@@ -11,76 +86,168 @@ def is_accessible(path):
     except (PermissionError, OSError):
         return False
 
-def discover_file_types(path):
-    """Discover all file types in the given path."""
-    extensions = set()
+# Directory listings reused across walks: dir path -> (st_mtime_ns, entries)
+_dir_cache = {}
+
+def _list_dir(dir_path):
+    """Return (path, is_dir, is_file, suffix, descend) for each accessible entry.
+
+    Listings are cached and only re-read once the directory's mtime changes.
+    """
     try:
-        for file_path in Path(path).rglob("*"):
-            if file_path.is_file() and is_accessible(file_path):
-                ext = file_path.suffix.lower()
-                if ext:
-                    extensions.add(ext)
-    except (PermissionError, OSError):
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return []
+    cached = _dir_cache.get(dir_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    children = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_link = entry.is_symlink()
+                    if is_link:
+                        entry.stat()  # Broken links are not accessible
+                    is_dir = entry.is_dir()
+                    is_file = entry.is_file()
+                except OSError:
+                    continue
+                # Same rule as Path.suffix
+                name = entry.name
+                i = name.rfind('.')
+                suffix = name[i:] if 0 < i < len(name) - 1 else ''
+                children.append((entry.path, is_dir, is_file, suffix, is_dir and not is_link))
+    except OSError:
         pass
-    return sorted(extensions)
+    _dir_cache[dir_path] = (mtime, children)
+    return children
+
+def _walk_cached(dir_path):
+    """Yield accessible entries below dir_path in the order rglob('*') does."""
+    children = _list_dir(dir_path)
+    yield from children
+    # One iterator per open directory, so entries are not re-yielded
+    # through a chain of nested generators
+    stack = [iter(children)]
+    while stack:
+        for child in stack[-1]:
+            if child[4]:
+                children = _list_dir(child[0])
+                yield from children
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
 
-def should_show_file(item, file_types, selection):
-    # Always show directories
-    if item.is_dir():
-        return True
-    # Show file if it's in selection
-    if selection and str(item) in selection:
-        return True
+def discover_file_types(path):
+    """Discover all file types in the given path."""
+    suffixes = {suffix for _, _, is_file, suffix, _ in _walk_cached(os.fspath(Path(path))) if is_file}
+    suffixes.discard('')
+    return sorted({suffix.lower() for suffix in suffixes})
+
+def _show_file_predicate(file_types, selection):
+    """Specialize should_show_file for one filter, checking for '*' only once."""
     # Show all files if "*" is in filters or no filters
     if not file_types or any(ft.strip() == "*" for ft in file_types):
-        return True
-    # Show files matching extensions
-    return item.suffix in file_types
+        return lambda item, path: True
+    file_types = frozenset(file_types)
+    selection = selection or ()
+    # Matching extensions and selected files first; directories always show
+    return lambda item, path: item.suffix in file_types or path in selection or item.is_dir()
+
+def should_show_file(item, file_types, selection):
+    return _show_file_predicate(file_types, selection)(item, str(item))
 
 def get_directory_contents(path, file_types, selection):
+    """List path as (item, accessible, str(item)) tuples, directories first."""
+    show_file = _show_file_predicate(file_types, selection)
     try:
-        items = sorted(
-            [item for item in Path(path).iterdir()],
-            key=lambda x: (x.is_file(), x.name.lower())
-        )
-        return [(item, is_accessible(item)) for item in items 
-                if should_show_file(item, file_types, selection)]
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                # One stat per entry answers both is_file() and is_accessible()
+                try:
+                    accessible = True
+                    is_file = stat.S_ISREG(entry.stat().st_mode)
+                except OSError:
+                    accessible = is_file = False
+                entries.append((is_file, entry.name.lower(), entry.path, accessible))
     except PermissionError:
         return []
+    entries.sort(key=lambda entry: entry[:2])
+    contents = []
+    for _, _, item_path, accessible in entries:
+        item = Path(item_path)
+        if show_file(item, item_path):
+            contents.append((item, accessible, item_path))
+    return contents
+
+def _format_rows(items, selection, ignored, ascii_mode=False):
+    """Build the display line and colour attribute for each listing row."""
+    dir_icon, file_icon, blocked_icon, marks = _ASCII_GLYPHS if ascii_mode else _UNICODE_GLYPHS
+    rows = [f"[{dir_icon} ../] (Up one level)"]
+    attrs = [_ATTR_NORMAL]
+    for item, accessible, path in items:
+        is_dir = item.is_dir()
+        if not accessible:
+            rows.append(f"{blocked_icon} {item.name}/" if is_dir else f"{blocked_icon} {item.name}")
+            attrs.append(_ATTR_INACCESSIBLE)
+            continue
+        state = _state(path, selection, ignored)
+        if is_dir:
+            rows.append(f"[{marks[state]}] {dir_icon} {item.name}/")
+        else:
+            rows.append(f"[{marks[state]}] {file_icon} {item.name}")
+        if state & _SELECTED:
+            attrs.append(_ATTR_INCLUDED)  # Selected file/dir
+        elif is_dir:
+            attrs.append(_ATTR_DIR)
+        else:
+            attrs.append(_ATTR_NORMAL)  # Normal file
+    return rows, attrs
+
+def _filter_label(file_types):
+    """Header text for the active filter, rebuilt only when the filter changes."""
+    return f"Filter: {', '.join(sorted(file_types))}"
+
+def _listing_key(path, file_types, selection_version):
+    """Key a directory listing by everything that can change its contents."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    return (str(path), frozenset(file_types), selection_version, mtime)
 
 def mark_subitems(selection, ignored, base_path, state, file_types):
-    for item in Path(base_path).rglob('*'):
-        if not is_accessible(item):
-            continue
-        path = str(item)
+    for path, is_dir, _, suffix, _ in _walk_cached(os.fspath(Path(base_path))):
         if state and path in ignored:
             ignored.pop(path)
         
         if state:
-            if item.is_dir() or item.suffix in file_types or path in selection:
+            if is_dir or suffix in file_types or path in selection:
                 selection[path] = True
         else:
             selection.pop(path, None)
 
 def mark_ignored(ignored, selection, base_path):
-    for item in Path(base_path).rglob('*'):
-        if not is_accessible(item):
-            continue
-        path = str(item)
-        if path in selection:
-            selection.pop(path)
+    """Ignore base_path and everything below it, deselecting it in the same walk."""
+    for path, _, _, _, _ in _walk_cached(os.fspath(Path(base_path))):
+        selection.pop(path, None)
         ignored[path] = True
     ignored[str(base_path)] = True
 
+def _remove_prefixed(mapping, path):
+    """Remove path and every key below it, without copying all the keys."""
+    subtree = path.rstrip(os.sep) + os.sep
+    for key in [key for key in mapping if key == path or key.startswith(subtree)]:
+        del mapping[key]
+
 def curses_file_selector(stdscr, start_path=".", preselected_filters=None, included_files=None, ignored_dirs=None, included_dirs=None):
     # Initialize curses
     curses.curs_set(0)
-    curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Selected
-    curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Normal
-    curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)    # Inaccessible
-    curses.init_pair(4, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Included
-    curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Header
-    curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)   # Directory
+    _init_colors()
     
     # Enable mouse support
     try:
@@ -90,6 +257,7 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
         mouse_enabled = False
     
     current_path = Path(start_path).resolve()
+    # Insertion-ordered dicts used as sets; every value is True
     selection = {}
     ignored = {}
     
@@ -104,6 +272,7 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
         common_code_types = {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.css', '.html', '.php', '.rb', '.go', '.rs', '.swift', '.kt'}
         auto_selected = [ext for ext in discovered_types if ext in common_code_types]
         file_types = set(auto_selected) if auto_selected else set(discovered_types[:10])  # Limit to first 10 if no common types
+    types_label = _filter_label(file_types)
     
     # Add included files
     if included_files:
@@ -119,79 +288,49 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
             if is_accessible(path):
                 mark_ignored(ignored, selection, path)
 
-    # Auto-select common directories and files
+    # Auto-select common directories and files. Their subtrees are only
+    # marked once the first frame is on screen (see deferred_roots below).
+    deferred_roots = []
     if start_path == "." and not (included_files or included_dirs):
         for item in current_path.iterdir():
             if not is_accessible(item):
                 continue
-            if item.is_dir() or (file_types and item.suffix in file_types):
+            is_dir = item.is_dir()
+            if is_dir or (file_types and item.suffix in file_types):
                 path = str(item.resolve())
                 selection[path] = True
-                if item.is_dir():
-                    mark_subitems(selection, ignored, path, True, file_types)
+                deferred_roots.append((path, is_dir))
 
     stack = [current_path]
     idx = 0
     top_line = 0
     show_help = False
     filter_mode = False
+    ascii_mode = _ascii_terminal()
+    # Bumped whenever selection or ignored changes; keys the listing cache
+    selection_version = 0
+    listing_key = None
+    # What is currently on screen, so cursor moves can repaint just two rows
+    drawn_frame = None
+    drawn_idx = 0
+    # Listings of recently hovered directories: listing key -> Future
+    prefetched = {}
 
     while True:
-        stdscr.clear()
         height, width = stdscr.getmaxyx()
-
-        # Header
-        header_color = curses.color_pair(5) | curses.A_BOLD
-        path_str = str(current_path)
-        if len(path_str) >= width - 10:
-            path_str = "..." + path_str[-(width-13):]
-        stdscr.addstr(0, 0, f"📁 {path_str}", header_color)
-        
-        # File type filter display
-        if file_types:
-            types_str = f"Filter: {', '.join(sorted(file_types))}"
-            if len(types_str) > width - 2:
-                types_str = types_str[:width-5] + "..."
-            stdscr.addstr(1, 0, types_str, curses.color_pair(4))
-        else:
-            stdscr.addstr(1, 0, "Filter: All files", curses.color_pair(4))
-        
-        # Instructions
-        if show_help:
-            help_lines = [
-                "🎯 NAVIGATION:",
-                "  ↑/↓/PgUp/PgDn: Navigate    SPACE: Toggle selection",
-                "  ←/→/Enter: Directories    TAB: File type manager",
-                "  i: Ignore item/dir        v: View selections",
-                "🖱️  MOUSE: Click to select, scroll to navigate",
-                "📝 FILTERING:",
-                "  f: Edit file types        a: Select all visible",
-                "  c: Clear all selections   r: Reset to discovered types",
-                "⚡ ACTIONS:",
-                "  q: Done with selection    ESC: Cancel",
-                "  h: Toggle this help"
-            ]
-            for i, line in enumerate(help_lines):
-                if i + 2 < height - 4:
-                    stdscr.addstr(i + 2, 0, line[:width-1], curses.color_pair(2))
-            help_end = len(help_lines) + 2
-        else:
-            stdscr.addstr(2, 0, "🎯 Navigation: ↑/↓ SPACE:Select TAB:Filter q:Done h:Help", curses.color_pair(2))
-            if mouse_enabled:
-                stdscr.addstr(3, 0, "🖱️  Mouse: Click items, scroll to navigate", curses.color_pair(2))
-            help_end = 4
-        
-        # Get directory contents
-        items = get_directory_contents(current_path, file_types, selection)
-        display_items = ["[📁 ../] (Up one level)"] + [
-            (f"🚫 {item.name}/" if not accessible else 
-             f"[{'✓' if selection.get(str(item), False) else '✗' if ignored.get(str(item), False) else ' '}] 📁 {item.name}/") if item.is_dir() else
-            (f"🚫 {item.name}" if not accessible else 
-             f"[{'✓' if selection.get(str(item), False) else '✗' if ignored.get(str(item), False) else ' '}] 📄 {item.name}")
-            for item, accessible in items
-        ]
-        
-        accessible_items = [True] + [acc for _, acc in items]
+        help_end = len(HELP_LINES) + 2 if show_help else 4
+
+        # Get directory contents, re-listing only when something changed
+        cache_key = _listing_key(current_path, file_types, selection_version)
+        if cache_key != listing_key:
+            future = prefetched.pop(cache_key, None)
+            if future is not None:
+                items = future.result()
+            else:
+                items = get_directory_contents(current_path, file_types, selection)
+            display_items, row_attrs = _format_rows(items, selection, ignored, ascii_mode)
+            accessible_items = [True] + [acc for _, acc, _ in items]
+            listing_key = cache_key
         
         # Ensure idx is valid
         if idx >= len(display_items):
@@ -203,50 +342,96 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
         elif idx >= top_line + height - help_end - 1:
             top_line = idx - (height - help_end - 2)
 
-        # Display items
-        for i, line in enumerate(display_items[top_line:top_line + height - help_end - 1]):
-            pos = i + top_line
-            if pos >= len(display_items):
-                break
-                
-            y_pos = i + help_end
+        def draw_row(pos):
+            y_pos = pos - top_line + help_end
+            line = display_items[pos]
             truncated_line = (line[:width - 1] + "…") if len(line) >= width else line
-            
-            # Determine color
-            if pos >= len(accessible_items):
-                continue
-                
             if pos == idx:
-                attr = curses.color_pair(1) | curses.A_BOLD  # Selected line
-            elif not accessible_items[pos]:
-                attr = curses.color_pair(3) | curses.A_DIM   # Inaccessible
-            elif pos > 0 and pos <= len(items):
-                item, _ = items[pos - 1]
-                if str(item) in selection:
-                    attr = curses.color_pair(4)  # Selected file/dir
-                elif item.is_dir():
-                    attr = curses.color_pair(6)  # Directory
-                else:
-                    attr = curses.color_pair(2)  # Normal file
+                attr = _ATTR_CURSOR  # Selected line
             else:
-                attr = curses.color_pair(2)  # Normal
+                attr = row_attrs[pos]
             
             try:
+                stdscr.move(y_pos, 0)
+                stdscr.clrtoeol()
                 stdscr.addstr(y_pos, 0, truncated_line, attr)
             except curses.error:
                 pass  # Ignore if line doesn't fit
 
-        # Status line
-        status_y = height - 1
-        sel_count = len([k for k, v in selection.items() if v])
-        ign_count = len([k for k, v in ignored.items() if v])
-        status = f"Selected: {sel_count} | Ignored: {ign_count} | Types: {len(file_types)} | {'Mouse' if mouse_enabled else 'Keys'}"
-        try:
-            stdscr.addstr(status_y, 0, status[:width-1], curses.color_pair(5))
-        except curses.error:
-            pass
+        frame_key = (listing_key, file_types, top_line, show_help, height, width)
+        if frame_key == drawn_frame:
+            # Only the cursor moved: repaint the two rows it touched
+            if idx != drawn_idx:
+                draw_row(drawn_idx)
+                draw_row(idx)
+        else:
+            stdscr.erase()
+
+            # Header
+            path_str = str(current_path)
+            if len(path_str) >= width - 10:
+                path_str = "..." + path_str[-(width-13):]
+            stdscr.addstr(0, 0, f"📁 {path_str}", _ATTR_HEADER)
+            
+            # File type filter display
+            if file_types:
+                types_str = types_label
+                if len(types_str) > width - 2:
+                    types_str = types_str[:width-5] + "..."
+                stdscr.addstr(1, 0, types_str, _ATTR_INCLUDED)
+            else:
+                stdscr.addstr(1, 0, "Filter: All files", _ATTR_INCLUDED)
+            
+            # Instructions
+            if show_help:
+                for i, line in enumerate(HELP_LINES):
+                    if i + 2 < height - 4:
+                        stdscr.addnstr(i + 2, 0, line, width - 1, _ATTR_NORMAL)
+            else:
+                stdscr.addstr(2, 0, "🎯 Navigation: ↑/↓ SPACE:Select TAB:Filter q:Done h:Help", _ATTR_NORMAL)
+                if mouse_enabled:
+                    stdscr.addstr(3, 0, "🖱️  Mouse: Click items, scroll to navigate", _ATTR_NORMAL)
+
+            # Display items
+            for pos in range(top_line, min(top_line + height - help_end - 1, len(display_items))):
+                draw_row(pos)
+
+            # Status line
+            status_y = height - 1
+            sel_count = len(selection)
+            ign_count = len(ignored)
+            status = f"Selected: {sel_count} | Ignored: {ign_count} | Types: {len(file_types)} | {'Mouse' if mouse_enabled else 'Keys'}"
+            try:
+                stdscr.addnstr(status_y, 0, status, width - 1, _ATTR_STATUS)
+            except curses.error:
+                pass
+            drawn_frame = frame_key
+        drawn_idx = idx
 
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+        if deferred_roots:
+            # Expand the auto-selected directories before handling any input.
+            # Replaying the roots in order keeps the selection order unchanged.
+            selection.clear()
+            for path, is_dir in deferred_roots:
+                selection[path] = True
+                if is_dir:
+                    mark_subitems(selection, ignored, path, True, file_types)
+            deferred_roots = None
+            selection_version += 1
+            continue
+
+        # List the hovered directory in the background so entering it is instant
+        if 0 < idx <= len(items):
+            hovered, accessible, _ = items[idx - 1]
+            if accessible and hovered.is_dir():
+                hover_key = _listing_key(hovered, file_types, selection_version)
+                if hover_key not in prefetched:
+                    if len(prefetched) >= 2:
+                        prefetched.pop(next(iter(prefetched))).cancel()
+                    prefetched[hover_key] = _prefetch(hovered, file_types, selection)
 
         # Get input
         key = stdscr.getch()
@@ -272,7 +457,7 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                                     idx = 0
                                     top_line = 0
                             elif idx > 0 and idx <= len(items):
-                                selected_item, accessible = items[idx - 1]
+                                selected_item, accessible, path = items[idx - 1]
                                 if accessible:
                                     # Determine what was clicked based on x position
                                     line_content = display_items[idx]
@@ -280,25 +465,22 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                                     # Check if click was on checkbox area [X] (positions 0-3)
                                     if mx <= 3 and line_content.startswith('['):
                                         # Checkbox click - toggle selection state
-                                        path = str(selected_item)
                                         
                                         # Cycle through states: unselected -> selected -> ignored -> unselected
-                                        if path not in selection and path not in ignored:
+                                        state = _state(path, selection, ignored)
+                                        if not state:
                                             # Unselected -> Selected
                                             selection[path] = True
                                             if selected_item.is_dir():
                                                 mark_subitems(selection, ignored, selected_item, True, file_types)
-                                        elif path in selection:
+                                        elif state & _SELECTED:
                                             # Selected -> Ignored
                                             selection.pop(path, None)
-                                            if selected_item.is_dir():
-                                                mark_subitems(selection, ignored, selected_item, False, file_types)
                                             mark_ignored(ignored, selection, selected_item)
                                         else:
                                             # Ignored -> Unselected
-                                            for key in list(ignored.keys()):
-                                                if key.startswith(path):
-                                                    ignored.pop(key)
+                                            _remove_prefixed(ignored, path)
+                                        selection_version += 1
                                     
                                     # Click on folder name/icon (positions 4+) for directories
                                     elif selected_item.is_dir() and mx > 3:
@@ -310,32 +492,29 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                                     
                                     # Click on file name for files - toggle selection
                                     elif selected_item.is_file():
-                                        path = str(selected_item)
-                                        if path not in selection and path not in ignored:
+                                        state = _state(path, selection, ignored)
+                                        if not state:
                                             selection[path] = True
-                                        elif path in selection:
+                                        elif state & _SELECTED:
                                             selection.pop(path, None)
                                             mark_ignored(ignored, selection, selected_item)
                                         else:
-                                            for key in list(ignored.keys()):
-                                                if key.startswith(path):
-                                                    ignored.pop(key)
+                                            _remove_prefixed(ignored, path)
+                                        selection_version += 1
                         
                         # Right click - always toggle ignore status
                         elif bstate & (curses.BUTTON3_CLICKED):
                             if idx > 0 and idx <= len(items):
-                                selected_item, accessible = items[idx - 1]
+                                selected_item, accessible, path = items[idx - 1]
                                 if accessible:
-                                    path = str(selected_item)
                                     if path in selection:
                                         selection.pop(path, None)
                                         mark_ignored(ignored, selection, selected_item)
                                     elif path in ignored:
-                                        for key in list(ignored.keys()):
-                                            if key.startswith(path):
-                                                ignored.pop(key)
+                                        _remove_prefixed(ignored, path)
                                     else:
                                         mark_ignored(ignored, selection, selected_item)
+                                    selection_version += 1
                 
                 # Mouse wheel scrolling
                 elif bstate & curses.BUTTON4_PRESSED:  # Scroll up
@@ -372,7 +551,7 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
 
         elif key in [curses.KEY_RIGHT, 10]:  # Enter
             if idx > 0 and idx <= len(items):
-                selected_item, accessible = items[idx - 1]
+                selected_item, accessible, path = items[idx - 1]
                 if accessible and selected_item.is_dir():
                     stack.append(selected_item)
                     current_path = selected_item
@@ -393,45 +572,38 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
 
         elif key == ord(' '):  # Space - toggle selection
             if idx > 0 and idx <= len(items):
-                selected_item, accessible = items[idx - 1]
+                selected_item, accessible, path = items[idx - 1]
                 if accessible:
-                    path = str(selected_item)
                     
                     # Cycle through states: unselected -> selected -> ignored -> unselected
-                    if path not in selection and path not in ignored:
+                    state = _state(path, selection, ignored)
+                    if not state:
                         # Unselected -> Selected
                         selection[path] = True
                         if selected_item.is_dir():
                             mark_subitems(selection, ignored, selected_item, True, file_types)
-                    elif path in selection:
+                    elif state & _SELECTED:
                         # Selected -> Ignored
                         selection.pop(path, None)
-                        if selected_item.is_dir():
-                            mark_subitems(selection, ignored, selected_item, False, file_types)
                         mark_ignored(ignored, selection, selected_item)
                     else:
                         # Ignored -> Unselected
-                        for key in list(ignored.keys()):
-                            if key.startswith(path):
-                                ignored.pop(key)
+                        _remove_prefixed(ignored, path)
+                    selection_version += 1
 
         elif key == ord('i'):  # Ignore
             if idx > 0 and idx <= len(items):
-                selected_item, accessible = items[idx - 1]
+                selected_item, accessible, path = items[idx - 1]
                 if accessible:
-                    path = str(selected_item)
                     if path in selection:
-                        for key in list(selection.keys()):
-                            if key.startswith(path):
-                                selection.pop(key)
+                        _remove_prefixed(selection, path)
                         mark_ignored(ignored, selection, selected_item)
                     else:
                         if path in ignored:
-                            for key in list(ignored.keys()):
-                                if key.startswith(path):
-                                    ignored.pop(key)
+                            _remove_prefixed(ignored, path)
                         else:
                             mark_ignored(ignored, selection, selected_item)
+                    selection_version += 1
 
         elif key == ord('f') or key == ord('\t'):  # Edit file types
             curses.curs_set(1)
@@ -456,48 +628,56 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                 else:
                     file_types = {f".{ext.strip()}" if not ext.strip().startswith(".") and ext.strip() != "*" else ext.strip() 
                                 for ext in new_input.split(',') if ext.strip()}
+                types_label = _filter_label(file_types)
             curses.curs_set(0)
+            drawn_frame = None
 
         elif key == ord('a'):  # Select all visible
-            for item, accessible in items:
+            for item, accessible, path in items:
                 if accessible:
-                    path = str(item)
                     selection[path] = True
                     if item.is_dir():
                         mark_subitems(selection, ignored, item, True, file_types)
+            selection_version += 1
 
         elif key == ord('c'):  # Clear all selections
             selection.clear()
             ignored.clear()
+            selection_version += 1
 
         elif key == ord('r'):  # Reset to discovered types
             file_types = set(discovered_types[:10])  # Reset to first 10 discovered
+            types_label = _filter_label(file_types)
 
         elif key == ord('h'):  # Toggle help
             show_help = not show_help
 
+        elif key == ord('A'):  # Toggle ASCII glyphs
+            ascii_mode = not ascii_mode
+            listing_key = None
+            drawn_frame = None
+
         elif key == ord('v'):  # View selections
             def view_selections():
                 v_idx = 0
                 v_top = 0
-                selected_paths = list(selection.keys())
-                ignored_paths = list(ignored.keys())
-                all_paths = selected_paths + ignored_paths
+                all_paths = list(selection) + list(ignored)
                 
                 while True:
-                    stdscr.clear()
+                    stdscr.erase()
                     stdscr.addstr(0, 0, "📋 Selected & Ignored Files/Directories", curses.color_pair(5) | curses.A_BOLD)
                     stdscr.addstr(1, 0, "✓: Selected  ✗: Ignored", curses.color_pair(2))
                     
                     for i, path in enumerate(all_paths[v_top:v_top + height - 4]):
                         if i + v_top >= len(all_paths):
                             break
-                        prefix = "✓ " if path in selected_paths else "✗ "
+                        is_selected = path in selection
+                        prefix = "✓ " if is_selected else "✗ "
                         display_path = path
                         if len(display_path) > width - 3:
                             display_path = "..." + display_path[-(width-6):]
                         
-                        color = curses.color_pair(4) if path in selected_paths else curses.color_pair(3)
+                        color = curses.color_pair(4) if is_selected else curses.color_pair(3)
                         if i + v_top == v_idx:
                             color |= curses.A_REVERSE
                             
@@ -511,7 +691,8 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                     except curses.error:
                         pass
                     
-                    stdscr.refresh()
+                    stdscr.noutrefresh()
+                    curses.doupdate()
                     key_v = stdscr.getch()
                     
                     if key_v == curses.KEY_DOWN and v_idx < len(all_paths) - 1:
@@ -537,20 +718,26 @@ def curses_file_selector(stdscr, start_path=".", preselected_filters=None, inclu
                     elif key_v == ord('q'):
                         break
             view_selections()
+            drawn_frame = None
 
         elif key == 27:  # Escape
             return None
         elif key == ord('q'):
             return {
-                "selected": [path for path, checked in selection.items() if checked],
-                "ignored": [path for path, is_ignored in ignored.items() if is_ignored],
+                "selected": list(selection),
+                "ignored": list(ignored),
                 "file_types": list(file_types)
             }
 
 def select_files(start_path=".", preselected_filters=None, included_files=None, ignored_dirs=None, included_dirs=None):
-    return curses.wrapper(curses_file_selector, 
-                         start_path=start_path,
-                         preselected_filters=preselected_filters,
-                         included_files=included_files,
-                         ignored_dirs=ignored_dirs,
-                         included_dirs=included_dirs)
\ No newline at end of file
+    try:
+        return curses.wrapper(curses_file_selector, 
+                             start_path=start_path,
+                             preselected_filters=preselected_filters,
+                             included_files=included_files,
+                             ignored_dirs=ignored_dirs,
+                             included_dirs=included_dirs)
+    finally:
+        # Don't leave worker threads (or pending listings) behind for the rest
+        # of the run, e.g. when outlines later fork worker processes
+        _shutdown_prefetch()
\ No newline at end of file
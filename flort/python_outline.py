@@ -24,11 +24,26 @@ The generated outlines are particularly useful for:
 
 import ast
 import logging
-from typing import List, Dict, Any, Optional, Union
+import os
+import shelve
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
 from .utils import write_file
 
+logger = logging.getLogger(__name__)
+
+# Below this many files, outlines are generated in-process: starting worker
+# processes costs more than parsing a handful of modules
+PARALLEL_OUTLINE_MIN = 4
+
+# Maximum number of files outlined by worker processes ahead of the writer
+OUTLINE_PREFETCH_LIMIT = 64
+
 
 def safe_ast_parse(source: str) -> Optional[ast.AST]:
     """
@@ -43,16 +58,16 @@ def safe_ast_parse(source: str) -> Optional[ast.AST]:
     try:
         return ast.parse(source)
     except SyntaxError as e:
-        logging.debug(f"Syntax error in Python code: {e}")
+        logger.debug("Syntax error in Python code: %s", e)
         return None
     except IndentationError as e:
-        logging.debug(f"Indentation error in Python code: {e}")
+        logger.debug("Indentation error in Python code: %s", e)
         return None
     except TypeError as e:
-        logging.debug(f"Type error parsing Python code: {e}")
+        logger.debug("Type error parsing Python code: %s", e)
         return None
     except Exception as e:
-        logging.error(f"Unexpected error parsing Python code: {e}")
+        logger.error("Unexpected error parsing Python code: %s", e)
         return None
 
 
@@ -69,15 +84,42 @@ def safe_ast_unparse(node: Optional[ast.AST]) -> Optional[str]:
     if node is None:
         return None
     
+    # Names and constants are most annotations, defaults and decorators;
+    # answer them without running the full unparser on every occurrence
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Constant:
+        try:
+            return _unparse_constant(type(node.value), node.value, node.kind)
+        except TypeError:
+            pass  # Unhashable value, unparse it normally below
+    
     try:
-        # Use ast.unparse if available (Python 3.9+)
-        if hasattr(ast, 'unparse'):
-            return ast.unparse(node)
-        else:
-            # Fallback for older Python versions
-            return _manual_unparse(node)
+        return _unparse(node)
     except Exception as e:
-        logging.debug(f"Error unparsing AST node: {e}")
+        logger.debug("Error unparsing AST node: %s", e)
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _unparse_constant(value_type: type, value: Any, kind: Optional[str]) -> Optional[str]:
+    """
+    Unparse a constant once per distinct value; the type is part of the key
+    so that 1, 1.0 and True stay distinct.
+    
+    Args:
+        value_type: Type of the constant's value
+        value: The constant's value
+        kind: The constant's kind ("u" for u-prefixed strings)
+        
+    Returns:
+        str: Source representation of the constant, or None if unparsing failed
+    """
+    try:
+        return _unparse(ast.Constant(value=value, kind=kind))
+    except Exception as e:
+        logger.debug("Error unparsing constant: %s", e)
         return None
 
 
@@ -109,6 +151,30 @@ def _manual_unparse(node: ast.AST) -> str:
         return "<complex_expression>"
 
 
+# ast.unparse exists on Python 3.9+; pick the unparser once rather than per call
+_unparse = getattr(ast, 'unparse', _manual_unparse)
+
+
+class ArgInfo(NamedTuple):
+    """
+    One function argument, as listed in a function's "args".
+    
+    Arguments are by far the most numerous outline records, so they are
+    tuples rather than dicts: about a third of the memory, and no per-field
+    hashing when signatures are formatted. Use _asdict() for a dict.
+    """
+    name: str
+    annotation: Optional[str]
+    default: Optional[str]
+    kind: str
+
+
+def _argument_info(name: str, annotation: Optional[ast.AST], default: Optional[ast.AST],
+                   kind: str) -> ArgInfo:
+    """Describe one function argument for extract_function_info."""
+    return ArgInfo(name, safe_ast_unparse(annotation), safe_ast_unparse(default), kind)
+
+
 def extract_function_info(node: ast.FunctionDef) -> Dict[str, Any]:
     """
     Extract comprehensive information from a function definition.
@@ -117,68 +183,46 @@ def extract_function_info(node: ast.FunctionDef) -> Dict[str, Any]:
         node: AST FunctionDef node
         
     Returns:
-        dict: Function information including signature, docstring, decorators
+        dict: Function information including signature, docstring, decorators;
+        "args" is a list of ArgInfo
     """
     try:
         # Extract arguments
-        args_info = []
-        
-        # Regular arguments
-        for i, arg in enumerate(node.args.args):
-            arg_info = {
-                "name": arg.arg,
-                "annotation": safe_ast_unparse(arg.annotation),
-                "default": None,
-                "kind": "positional"
-            }
-            
-            # Handle defaults (they align with the end of the args list)
-            defaults_offset = len(node.args.args) - len(node.args.defaults)
-            if i >= defaults_offset:
-                default_idx = i - defaults_offset
-                if default_idx < len(node.args.defaults):
-                    arg_info["default"] = safe_ast_unparse(node.args.defaults[default_idx])
-            
-            args_info.append(arg_info)
+        arguments = node.args
+        positional = arguments.args
+        defaults = arguments.defaults
+        
+        # Regular arguments; defaults align with the end of the args list
+        # (and may also cover positional-only arguments before it)
+        with_defaults = min(len(positional), len(defaults))
+        split = len(positional) - with_defaults
+        args_info = [
+            _argument_info(arg.arg, arg.annotation, None, "positional")
+            for arg in positional[:split]
+        ]
+        args_info.extend(
+            _argument_info(arg.arg, arg.annotation, default, "positional")
+            for arg, default in zip(positional[split:], defaults[len(defaults) - with_defaults:])
+        )
         
         # *args
-        if node.args.vararg:
-            args_info.append({
-                "name": f"*{node.args.vararg.arg}",
-                "annotation": safe_ast_unparse(node.args.vararg.annotation),
-                "default": None,
-                "kind": "vararg"
-            })
-        
-        # Keyword-only arguments
-        for i, arg in enumerate(node.args.kwonlyargs):
-            arg_info = {
-                "name": arg.arg,
-                "annotation": safe_ast_unparse(arg.annotation),
-                "default": None,
-                "kind": "keyword_only"
-            }
-            
-            if i < len(node.args.kw_defaults) and node.args.kw_defaults[i]:
-                arg_info["default"] = safe_ast_unparse(node.args.kw_defaults[i])
-            
-            args_info.append(arg_info)
+        vararg = arguments.vararg
+        if vararg:
+            args_info.append(_argument_info(f"*{vararg.arg}", vararg.annotation, None, "vararg"))
+        
+        # Keyword-only arguments (kw_defaults holds None where there is no default)
+        args_info.extend(
+            _argument_info(arg.arg, arg.annotation, default, "keyword_only")
+            for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults)
+        )
         
         # **kwargs
-        if node.args.kwarg:
-            args_info.append({
-                "name": f"**{node.args.kwarg.arg}",
-                "annotation": safe_ast_unparse(node.args.kwarg.annotation),
-                "default": None,
-                "kind": "kwarg"
-            })
+        kwarg = arguments.kwarg
+        if kwarg:
+            args_info.append(_argument_info(f"**{kwarg.arg}", kwarg.annotation, None, "kwarg"))
         
         # Extract decorators
-        decorators = []
-        for decorator in node.decorator_list:
-            decorator_str = safe_ast_unparse(decorator)
-            if decorator_str:
-                decorators.append(decorator_str)
+        decorators = [text for text in map(safe_ast_unparse, node.decorator_list) if text]
         
         return {
             "type": "function",
@@ -192,7 +236,7 @@ def extract_function_info(node: ast.FunctionDef) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logging.warning(f"Error extracting function info for {getattr(node, 'name', 'unknown')}: {e}")
+        logger.warning("Error extracting function info for %s: %s", getattr(node, 'name', 'unknown'), e)
         return {
             "type": "function",
             "name": getattr(node, 'name', 'unknown'),
@@ -205,30 +249,50 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
     """
     Extract comprehensive information from a class definition.
     
+    Nested classes are handled with an explicit work stack rather than
+    recursion, so deeply nested (e.g. generated) classes cannot exhaust
+    the interpreter's recursion limit.
+    
     Args:
         node: AST ClassDef node
         
     Returns:
         dict: Class information including methods, inheritance, decorators
     """
+    class_info: Dict[str, Any] = {}
+    # (class node, dict to fill, whether it is nested); a nested class's dict
+    # is already in its parent's nested_classes list, keeping source order
+    stack = [(node, class_info, False)]
+    while stack:
+        class_node, info, is_nested = stack.pop()
+        info.update(_extract_class_fields(class_node, stack))
+        if is_nested:
+            info["is_nested"] = True
+    return class_info
+
+
+def _extract_class_fields(node: ast.ClassDef, stack: list) -> Dict[str, Any]:
+    """
+    Extract one class's information, queueing its nested classes on stack.
+    
+    Args:
+        node: AST ClassDef node
+        stack: Work stack of extract_class_info
+        
+    Returns:
+        dict: Class information; nested class entries are filled in later
+    """
     try:
         # Extract base classes
-        bases = []
-        for base in node.bases:
-            base_str = safe_ast_unparse(base)
-            if base_str:
-                bases.append(base_str)
+        bases = [text for text in map(safe_ast_unparse, node.bases) if text]
         
         # Extract decorators
-        decorators = []
-        for decorator in node.decorator_list:
-            decorator_str = safe_ast_unparse(decorator)
-            if decorator_str:
-                decorators.append(decorator_str)
+        decorators = [text for text in map(safe_ast_unparse, node.decorator_list) if text]
         
         # Extract methods and nested classes
         methods = []
         nested_classes = []
+        pending = []
         
         for child in node.body:
             if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -236,11 +300,11 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
                 method_info["is_method"] = True
                 methods.append(method_info)
             elif isinstance(child, ast.ClassDef):
-                nested_class_info = extract_class_info(child)
-                nested_class_info["is_nested"] = True
+                nested_class_info: Dict[str, Any] = {}
                 nested_classes.append(nested_class_info)
+                pending.append((child, nested_class_info, True))
         
-        return {
+        info = {
             "type": "class",
             "name": node.name,
             "bases": bases,
@@ -250,9 +314,12 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
             "nested_classes": nested_classes,
             "lineno": node.lineno
         }
+        # Only queue nested classes once this class extracted cleanly
+        stack.extend(pending)
+        return info
         
     except Exception as e:
-        logging.warning(f"Error extracting class info for {getattr(node, 'name', 'unknown')}: {e}")
+        logger.warning("Error extracting class info for %s: %s", getattr(node, 'name', 'unknown'), e)
         return {
             "type": "class",
             "name": getattr(node, 'name', 'unknown'),
@@ -261,6 +328,41 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
         }
 
 
+def _extract_module_function(node: ast.FunctionDef) -> Dict[str, Any]:
+    """Extract a module-level (non-method) function."""
+    func_info = extract_function_info(node)
+    func_info["is_method"] = False
+    return func_info
+
+
+# Extractor for each kind of module-level definition, dispatched on node type
+_MODULE_EXTRACTORS = {
+    ast.ClassDef: extract_class_info,
+    ast.FunctionDef: _extract_module_function,
+    ast.AsyncFunctionDef: _extract_module_function,
+}
+
+
+def _module_definitions(nodes) -> Iterator[ast.AST]:
+    """
+    Yield module-level class and function definitions in source order.
+    
+    Definitions inside module-level if/try/with/for blocks count as module
+    level; class and function bodies are left to extract_class_info.
+    
+    Args:
+        nodes: Statements to search, normally the module body
+        
+    Yields:
+        ast.AST: ClassDef, FunctionDef or AsyncFunctionDef nodes
+    """
+    for node in nodes:
+        if type(node) in _MODULE_EXTRACTORS:
+            yield node
+        elif not isinstance(node, ast.expr):
+            yield from _module_definitions(ast.iter_child_nodes(node))
+
+
 def analyze_python_file(file_path: Path) -> List[Dict[str, Any]]:
     """
     Analyze a Python file and extract all classes and functions.
@@ -271,51 +373,44 @@ def analyze_python_file(file_path: Path) -> List[Dict[str, Any]]:
     Returns:
         list: List of dictionaries containing class/function information
     """
+    return list(iter_python_symbols(file_path))
+
+
+def iter_python_symbols(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Extract a Python file's classes and functions one at a time.
+    
+    Yields the same dictionaries as analyze_python_file, so each symbol can
+    be formatted and released as soon as it is extracted.
+    
+    Args:
+        file_path: Path to the Python file to analyze
+        
+    Yields:
+        dict: Class/function information, or a single error entry
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            source = f.read()
+        # One read and one decode; no text-mode newline translation is needed
+        # because the parser normalizes line endings itself
+        source = Path(file_path).read_bytes().decode('utf-8', errors='replace')
     except Exception as e:
-        logging.error(f"Failed to read file {file_path}: {e}")
-        return [{"type": "error", "message": f"Failed to read file: {str(e)}"}]
+        logger.error("Failed to read file %s: %s", file_path, e)
+        yield {"type": "error", "message": f"Failed to read file: {str(e)}"}
+        return
 
     tree = safe_ast_parse(source)
     if tree is None:
-        return [{"type": "error", "message": "Failed to parse Python code"}]
-
-    results = []
+        yield {"type": "error", "message": "Failed to parse Python code"}
+        return
     
-    # Walk the AST and extract top-level classes and functions
-    for node in ast.walk(tree):
+    # Module-level classes and functions, already in source order
+    for node in _module_definitions(tree.body):
         try:
-            # Only process top-level nodes (not nested)
-            if hasattr(node, 'parent') and node.parent is not None:
-                continue
-                
-            if isinstance(node, ast.ClassDef):
-                class_info = extract_class_info(node)
-                results.append(class_info)
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Check if this function is at module level
-                parent_found = False
-                for parent in ast.walk(tree):
-                    if isinstance(parent, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if hasattr(parent, 'body') and node in parent.body and parent != node:
-                            parent_found = True
-                            break
-                
-                if not parent_found:
-                    func_info = extract_function_info(node)
-                    func_info["is_method"] = False
-                    results.append(func_info)
-                    
+            symbol = _MODULE_EXTRACTORS[type(node)](node)
         except Exception as e:
-            logging.debug(f"Error processing AST node: {e}")
+            logger.debug("Error processing AST node: %s", e)
             continue
-    
-    # Sort by line number for consistent output
-    results.sort(key=lambda x: x.get('lineno', 0))
-    
-    return results
+        yield symbol
 
 
 def format_function_signature(func_info: Dict[str, Any]) -> str:
@@ -336,11 +431,11 @@ def format_function_signature(func_info: Dict[str, Any]) -> str:
         arg_strings = []
         
         for arg in args:
-            arg_str = arg["name"]
-            if arg.get("annotation"):
-                arg_str += f": {arg['annotation']}"
-            if arg.get("default"):
-                arg_str += f" = {arg['default']}"
+            arg_str = arg.name
+            if arg.annotation:
+                arg_str += f": {arg.annotation}"
+            if arg.default:
+                arg_str += f" = {arg.default}"
             arg_strings.append(arg_str)
         
         signature = f"{func_info['name']}({', '.join(arg_strings)})"
@@ -351,7 +446,7 @@ def format_function_signature(func_info: Dict[str, Any]) -> str:
         return signature
         
     except Exception as e:
-        logging.debug(f"Error formatting function signature: {e}")
+        logger.debug("Error formatting function signature: %s", e)
         return f"{func_info.get('name', 'unknown')} (formatting error)"
 
 
@@ -368,79 +463,125 @@ def format_outline_for_display(symbol_map: List[Dict[str, Any]]) -> str:
     if not symbol_map:
         return "No Python symbols found."
     
-    output = []
+    return "\n".join(iter_outline_chunks(symbol_map))
+
+
+def _docstring_lines(docstring: str, limit: int, indent: str) -> List[str]:
+    """
+    Format the first lines of a docstring, noting how many more there are.
+    
+    Only the shown lines are split off; the rest are counted, not split, so
+    long docstrings cost no more than short ones.
+    
+    Args:
+        docstring: Docstring text
+        limit: Number of lines to show
+        indent: Indentation of the DOCSTRING label
+        
+    Returns:
+        list: Outline lines for the docstring
+    """
+    text = docstring.strip()
+    lines = text.split('\n', limit)
+    output = [f"{indent}DOCSTRING:"]
+    output.extend(f"{indent}  {line.strip()}" for line in lines[:limit])
+    if len(lines) > limit:
+        remaining = text.count('\n') + 1 - limit
+        output.append(f"{indent}  ... ({remaining} more lines)")
+    return output
+
 
+def iter_outline_chunks(symbol_map: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield the formatted outline one symbol at a time.
+    
+    Joining the chunks with newlines gives format_outline_for_display's text.
+    
+    Args:
+        symbol_map: Extracted symbol information (a list or a symbol stream)
+        
+    Yields:
+        str: Outline lines for one top-level symbol
+    """
     for item in symbol_map:
+        # Fragments are joined once per symbol; measured faster than io.StringIO
+        output: List[str] = []
         try:
-            if item.get("type") == "error":
-                output.append(f"\nERROR: {item['message']}")
-                continue
-
-            if item.get("type") == "class":
-                # Format class header
-                class_line = f"\nCLASS: {item['name']}"
-                if item.get("bases"):
-                    class_line += f"({', '.join(item['bases'])})"
-                output.append(class_line)
-                
-                # Add decorators
-                if item.get("decorators"):
-                    output.append(f"  DECORATORS: {', '.join(item['decorators'])}")
-                
-                # Add docstring
-                if item.get("docstring"):
-                    docstring_lines = item['docstring'].strip().split('\n')
-                    output.append(f"  DOCSTRING:")
-                    for line in docstring_lines[:3]:  # Limit to first 3 lines
-                        output.append(f"    {line.strip()}")
-                    if len(docstring_lines) > 3:
-                        output.append(f"    ... ({len(docstring_lines) - 3} more lines)")
-                
-                # Add methods
-                for method in item.get("methods", []):
-                    method_sig = format_function_signature(method)
-                    method_prefix = "ASYNC METHOD" if method.get("is_async") else "METHOD"
-                    output.append(f"\n  {method_prefix}: {method_sig}")
-                    
-                    if method.get("decorators"):
-                        output.append(f"    DECORATORS: {', '.join(method['decorators'])}")
-                    
-                    if method.get("docstring"):
-                        method_doc_lines = method['docstring'].strip().split('\n')
-                        output.append(f"    DOCSTRING:")
-                        for line in method_doc_lines[:2]:  # Limit to first 2 lines for methods
-                            output.append(f"      {line.strip()}")
-                        if len(method_doc_lines) > 2:
-                            output.append(f"      ... ({len(method_doc_lines) - 2} more lines)")
-                
-                # Add nested classes
-                for nested_class in item.get("nested_classes", []):
-                    output.append(f"\n  NESTED CLASS: {nested_class['name']}")
-                    if nested_class.get("docstring"):
-                        output.append(f"    DOCSTRING: {nested_class['docstring'][:100]}...")
-                        
-            elif item.get("type") == "function":
-                # Format function
-                func_sig = format_function_signature(item)
-                func_prefix = "ASYNC FUNCTION" if item.get("is_async") else "FUNCTION"
-                output.append(f"\n{func_prefix}: {func_sig}")
-                
-                if item.get("decorators"):
-                    output.append(f"  DECORATORS: {', '.join(item['decorators'])}")
-                
-                if item.get("docstring"):
-                    func_doc_lines = item['docstring'].strip().split('\n')
-                    output.append(f"  DOCSTRING:")
-                    for line in func_doc_lines[:3]:  # Limit to first 3 lines
-                        output.append(f"    {line.strip()}")
-                    if len(func_doc_lines) > 3:
-                        output.append(f"    ... ({len(func_doc_lines) - 3} more lines)")
-                        
+            formatter = _SYMBOL_FORMATTERS.get(item.get("type"))
+            if formatter is not None:
+                formatter(item, output)
         except Exception as e:
-            logging.error(f"Error formatting outline item: {e}")
+            logger.error("Error formatting outline item: %s", e)
             output.append(f"\nERROR: Failed to format item: {str(e)}")
 
-    return "\n".join(output)
+        if output:
+            yield "\n".join(output)
+
+
+def _format_error(item: Dict[str, Any], output: List[str]) -> None:
+    """Append the outline lines for a file-level error entry."""
+    output.append(f"\nERROR: {item['message']}")
+
+
+def _format_class(item: Dict[str, Any], output: List[str]) -> None:
+    """Append the outline lines for a class, its methods and nested classes."""
+    append = output.append
+    extend = output.extend
+    
+    # Format class header
+    class_line = f"\nCLASS: {item['name']}"
+    if item.get("bases"):
+        class_line += f"({', '.join(item['bases'])})"
+    append(class_line)
+    
+    # Add decorators
+    if item.get("decorators"):
+        append(f"  DECORATORS: {', '.join(item['decorators'])}")
+    
+    # Add docstring
+    if item.get("docstring"):
+        extend(_docstring_lines(item['docstring'], 3, "  "))  # Limit to first 3 lines
+    
+    # Add methods
+    for method in item.get("methods", []):
+        method_sig = format_function_signature(method)
+        method_prefix = "ASYNC METHOD" if method.get("is_async") else "METHOD"
+        append(f"\n  {method_prefix}: {method_sig}")
+        
+        if method.get("decorators"):
+            append(f"    DECORATORS: {', '.join(method['decorators'])}")
+        
+        if method.get("docstring"):
+            # Limit to first 2 lines for methods
+            extend(_docstring_lines(method['docstring'], 2, "    "))
+    
+    # Add nested classes
+    for nested_class in item.get("nested_classes", []):
+        append(f"\n  NESTED CLASS: {nested_class['name']}")
+        if nested_class.get("docstring"):
+            append(f"    DOCSTRING: {nested_class['docstring'][:100]}...")
+
+
+def _format_function(item: Dict[str, Any], output: List[str]) -> None:
+    """Append the outline lines for a module-level function."""
+    func_sig = format_function_signature(item)
+    func_prefix = "ASYNC FUNCTION" if item.get("is_async") else "FUNCTION"
+    output.append(f"\n{func_prefix}: {func_sig}")
+    
+    if item.get("decorators"):
+        output.append(f"  DECORATORS: {', '.join(item['decorators'])}")
+    
+    if item.get("docstring"):
+        output.extend(_docstring_lines(item['docstring'], 3, "  "))  # Limit to first 3 lines
+
+
+# Formatter for each symbol type, dispatched on the symbol's "type"; formatters
+# append to the caller's list so a failure still keeps the lines already made
+_SYMBOL_FORMATTERS = {
+    "error": _format_error,
+    "class": _format_class,
+    "function": _format_function,
+}
 
 
 def process_python_file(file_path: Path) -> str:
@@ -454,21 +595,41 @@ def process_python_file(file_path: Path) -> str:
         str: Formatted outline of the file
     """
     try:
-        symbol_map = analyze_python_file(file_path)
-        return format_outline_for_display(symbol_map)
+        return "\n".join(iter_python_outline(file_path))
     except Exception as e:
         error_msg = f"ERROR: Failed to process file: {str(e)}"
-        logging.error(f"Error processing Python file {file_path}: {e}")
+        logger.error("Error processing Python file %s: %s", file_path, e)
         return error_msg
 
 
-def python_outline_files(file_list: List[Dict[str, Any]], output: str) -> bool:
+def iter_python_outline(file_path: Path) -> Iterator[str]:
+    """
+    Analyze a Python file and yield its formatted outline in chunks.
+    
+    Args:
+        file_path: Path to the Python file to process
+        
+    Yields:
+        str: Outline chunks, to be joined with newlines
+    """
+    # Format each symbol as it is extracted rather than collecting them first
+    symbols = iter_python_symbols(file_path)
+    first = next(symbols, None)
+    if first is None:
+        yield "No Python symbols found."
+        return
+    yield from iter_outline_chunks(chain((first,), symbols))
+
+
+def python_outline_files(file_list: List[Dict[str, Any]], output: str,
+                         use_cache: bool = False) -> bool:
     """
     Generate Python outlines for all Python files in the file list.
     
     Args:
         file_list: List of file dictionaries with path and metadata
         output: Output file path or "stdio"
+        use_cache: Reuse outlines of unchanged files from the on-disk cache
         
     Returns:
         bool: True if outline generation was successful
@@ -478,29 +639,265 @@ def python_outline_files(file_list: List[Dict[str, Any]], output: str) -> bool:
     
     python_files = [
         item for item in file_list 
-        if item.get("type") == "file" and item["path"].suffix.lower() == '.py'
+        if item.get("type") == "file" and _is_python_path(item["path"])
     ]
     
     if not python_files:
         return write_file(output, "\nNo Python files found for outline generation.\n\n")
     
-    logging.info(f"Generating outlines for {len(python_files)} Python files")
+    logger.info("Generating outlines for %s Python files", len(python_files))
+    
+    paths = [item["path"] for item in python_files]
+    cache = _open_outline_cache() if use_cache else None
+    if cache is None:
+        outlines = _iter_outlines(paths)
+    else:
+        outlines = _iter_cached_outlines(paths, cache)
+    try:
+        return _write_outlines(python_files, outlines, output)
+    finally:
+        # Shut down any worker pool, and flush the cache, even if writing stopped early
+        outlines.close()
+        if cache is not None:
+            cache.close()
+
+
+def _iter_outlines(paths: List[str], task: Optional[Callable[[Path], Any]] = None) -> Iterator[Any]:
+    """
+    Yield the outline of each path, in order, using worker processes when worthwhile.
+    
+    Args:
+        paths: Python file paths to outline
+        task: Function to run on each path instead of producing outline chunks
+        
+    Yields:
+        Outline chunks (or task's result), or the exception raised, for each path
+    """
+    if not paths:
+        return
+    
+    # In-process outlines are streamed chunk by chunk; workers return them whole
+    sequential = task or iter_python_outline
+    pooled = task or _whole_python_outline
+    if len(paths) < PARALLEL_OUTLINE_MIN or (os.cpu_count() or 1) < 2:
+        yield from map(sequential, paths)
+        return
+    
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_outline_worker,
+            initargs=(logging.getLogger().getEffectiveLevel(),)
+        )
+    except (OSError, NotImplementedError, ImportError) as e:
+        # No working multiprocessing on this platform
+        logger.debug("Generating outlines sequentially: %s", e)
+        yield from map(sequential, paths)
+        return
+    
+    with executor:
+        # At most OUTLINE_PREFETCH_LIMIT files are in flight, which bounds the
+        # finished outlines held in memory ahead of the writer
+        pending = deque()
+        try:
+            for path in paths:
+                pending.append(executor.submit(pooled, path))
+                if len(pending) >= OUTLINE_PREFETCH_LIMIT:
+                    yield _future_outline(pending.popleft())
+            while pending:
+                yield _future_outline(pending.popleft())
+        finally:
+            # Skip work that is no longer needed if writing stopped early
+            for future in pending:
+                future.cancel()
+
+
+def _whole_python_outline(file_path: Path) -> Iterable[str]:
+    """Return a file's outline as a single chunk."""
+    return (process_python_file(file_path),)
+
+
+def _cacheable_outline(file_path: Path) -> Tuple[str, bool]:
+    """
+    Return a file's outline and whether it may be cached.
+    
+    Outlines with an error entry (unreadable or unparsable file, failed
+    extraction) are not cacheable: a permission fix changes neither mtime
+    nor size, so a cached error would outlive its cause.
+    
+    Args:
+        file_path: Path to the Python file to process
+        
+    Returns:
+        tuple: (outline text, True if no symbol reported an error)
+    """
+    try:
+        symbols = analyze_python_file(file_path)
+        text = format_outline_for_display(symbols)
+    except Exception as e:
+        logger.error("Error processing Python file %s: %s", file_path, e)
+        return f"ERROR: Failed to process file: {str(e)}", False
+    return text, not any(symbol.get("type") == "error" or "error" in symbol for symbol in symbols)
+
+
+def _outline_cache_path() -> str:
+    """Return the outline cache location, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'flort', 'outlines')
+
+
+def _open_outline_cache() -> Optional[shelve.Shelf]:
+    """
+    Open the persistent outline cache.
+    
+    Returns:
+        Optional[shelve.Shelf]: The cache, or None if it cannot be opened
+    """
+    cache_path = _outline_cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        return shelve.open(cache_path)
+    except Exception as e:
+        # Unwritable cache directory, or another flort holding the database lock
+        logger.warning("Outline cache unavailable, generating all outlines: %s", e)
+        return None
+
+
+def _outline_cache_entry(path: Union[str, Path]) -> Optional[tuple]:
+    """
+    Build the cache key and stamp for a file.
+    
+    Entries are keyed by absolute path so a changed file replaces its old
+    outline instead of accumulating; the stamp of modification time and size
+    decides whether the stored outline is still current. The flort version is
+    part of the stamp so a formatter change never serves outlines produced by
+    an older release.
+    
+    Args:
+        path: Python file path
+        
+    Returns:
+        Optional[tuple]: (key, stamp), or None if the file cannot be stat'ed
+    """
+    from . import __version__
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), (__version__, st.st_mtime_ns, st.st_size)
+
+
+def _iter_cached_outlines(paths: List[str],
+                          cache: shelve.Shelf) -> Iterator[Union[Iterable[str], Exception]]:
+    """
+    Yield each path's outline from the cache, generating and storing the misses.
+    
+    Args:
+        paths: Python file paths to outline
+        cache: Open outline cache
+        
+    Yields:
+        Outline chunks, or the exception raised, for each path
+    """
+    entries = [_outline_cache_entry(path) for path in paths]
+    cached = []
+    for entry in entries:
+        stored = cache.get(entry[0]) if entry is not None else None
+        cached.append(stored[1] if stored is not None and stored[0] == entry[1] else None)
+    misses = [path for path, text in zip(paths, cached) if text is None]
+    logger.info("Outline cache: %s of %s files unchanged", len(paths) - len(misses), len(paths))
+    
+    generated = _iter_outlines(misses, _cacheable_outline)
+    try:
+        for entry, text in zip(entries, cached):
+            if text is not None:
+                yield (text,)
+                continue
+            result = next(generated)
+            if isinstance(result, Exception):
+                yield result
+                continue
+            text, cacheable = result
+            if cacheable and entry is not None:
+                cache[entry[0]] = (entry[1], text)
+            yield (text,)
+    finally:
+        generated.close()
+
+
+def _is_python_path(path: Union[str, Path]) -> bool:
+    """
+    Check for a .py suffix (any case) on the path string.
+    
+    Matches Path(path).suffix.lower() == '.py', including treating a file
+    named just ".py" as having no suffix, without building the suffix.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        bool: True if the path names a Python source file
+    """
+    path = os.fspath(path)
+    return path[-3:].lower() == '.py' and path[-4:-3] not in ('', '/', os.sep)
+
+
+def _init_outline_worker(level: int) -> None:
+    """Give outline worker processes the parent's logging level."""
+    logging.basicConfig(level=level)
+
+
+def _future_outline(future: Future) -> Any:
+    """Return a worker's result, or the exception it raised."""
+    try:
+        return future.result()
+    except Exception as e:
+        return e
+
+
+def _write_outlines(python_files: List[Dict[str, Any]],
+                    outlines: Iterator[Union[Iterable[str], Exception]], output: str) -> bool:
+    """
+    Write each file's outline under its header, in file list order.
     
-    for item in python_files:
-        file_path = item["path"]
+    Args:
+        python_files: File dictionaries of the Python files being outlined
+        outlines: Outline chunks or raised exception for each file, in the same order
+        output: Output file path or "stdio"
+        
+    Returns:
+        bool: True if all outlines were written
+    """
+    for item, outline in zip(python_files, outlines):
         relative_path = item["relative_path"]
         
-        if not write_file(output, f"\n### File: {relative_path}\n"):
-            return False
+        # Text not yet written; the header goes out with the first chunk
+        pending = f"\n### File: {relative_path}\n"
         
-        try:
-            outline = process_python_file(file_path)
-            if not write_file(output, outline + "\n"):
+        if isinstance(outline, Exception):
+            error_msg = f"Error processing {relative_path}: {str(outline)}\n"
+            logger.error(error_msg.strip())
+            if not write_file(output, pending + error_msg):
                 return False
+            continue
+        
+        # Write chunks as they are produced rather than building the whole
+        # outline, holding back the latest so the trailer goes out with it;
+        # a single-chunk outline is then one write
+        separator = ""
+        try:
+            for chunk in outline:
+                if separator:
+                    if not write_file(output, pending):
+                        return False
+                    pending = ""
+                pending += separator + chunk
+                separator = "\n"
         except Exception as e:
-            error_msg = f"Error processing {relative_path}: {str(e)}\n"
-            logging.error(error_msg.strip())
-            if not write_file(output, error_msg):
-                return False
+            logger.error("Error processing Python file %s: %s", item['path'], e)
+            pending += f"{separator}ERROR: Failed to process file: {str(e)}"
+        if not write_file(output, pending + "\n"):
+            return False
     
-    return write_file(output, "\n")
\ No newline at end of file
+    return write_file(output, "\n")
@@ -8,7 +8,22 @@ Provides basic interactive functionality through text prompts.
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Files found by the last walk of each start directory, keyed by
+# (start path, directory mtime, ignored prefixes): [(file path, lowercase
+# suffix), ...]. Discovery fills it and previews reuse it; cleared when a
+# session ends, however it ends.
+_scan_cache: Dict[Tuple[str, int, frozenset], List[Tuple[str, str]]] = {}
+
+# Types auto-selected when no filters are preselected
+_COMMON_CODE_TYPES = frozenset({
+    '.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.css', '.html', '.php', '.rb',
+    '.go', '.rs', '.swift', '.kt', '.md', '.txt', '.yml', '.yaml', '.json', '.xml'
+})
+
+# Types added by the "Quick-select common types" option
+_COMMON_QUICK_TYPES = frozenset({'.py', '.js', '.ts', '.md', '.txt', '.json', '.yml', '.css', '.html'})
 
 
 def simple_select_files(
@@ -35,220 +50,222 @@ def simple_select_files(
     print("=" * 50)
     print("Interactive file selection (text-based fallback)")
     
-    # Discover file types in the directory
-    print(f"\n🔍 Discovering file types in {start_path}...")
-    discovered_types = discover_file_types_simple(start_path)
-    
-    if discovered_types:
-        print(f"📋 Found {len(discovered_types)} file types:")
-        for i, ext in enumerate(discovered_types[:20], 1):  # Show first 20
-            print(f"  {i:2d}. {ext}")
-        if len(discovered_types) > 20:
-            print(f"  ... and {len(discovered_types) - 20} more")
-    else:
-        print("❌ No file types discovered")
-    
-    # Initialize with discovery or preselected
-    if preselected_filters:
-        file_types = set(preselected_filters)
-        print(f"\n🎯 Using preselected filters: {', '.join(file_types)}")
-    else:
-        # Auto-select common code types
-        common_code_types = {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.css', '.html', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.md', '.txt', '.yml', '.yaml', '.json', '.xml'}
-        auto_selected = [ext for ext in discovered_types if ext in common_code_types]
+    try:
+        # Discover file types in the directory
+        print(f"\n🔍 Discovering file types in {start_path}...")
+        discovered_types = discover_file_types_simple(start_path, ignored_dirs)
         
-        if auto_selected:
-            file_types = set(auto_selected)
-            print(f"\n🎯 Auto-selected common code types: {', '.join(sorted(file_types))}")
+        if discovered_types:
+            print(f"📋 Found {len(discovered_types)} file types:")
+            for i, ext in enumerate(discovered_types[:20], 1):  # Show first 20
+                print(f"  {i:2d}. {ext}")
+            if len(discovered_types) > 20:
+                print(f"  ... and {len(discovered_types) - 20} more")
         else:
-            # Offer to select from discovered types
-            file_types = set()
-            print(f"\n🤔 No common code types found. Select from discovered types:")
-            if discovered_types:
-                print("Enter numbers (comma-separated) or 'all' for all types:")
-                try:
-                    choice = input("❓ Your choice: ").strip().lower()
-                    if choice == 'all':
-                        file_types = set(discovered_types)
-                    elif choice:
-                        numbers = [int(x.strip()) for x in choice.split(',') if x.strip().isdigit()]
-                        file_types = {discovered_types[i-1] for i in numbers if 1 <= i <= len(discovered_types)}
-                except (ValueError, IndexError, KeyboardInterrupt):
-                    file_types = set(discovered_types[:5])  # Default to first 5
-            
-            if not file_types:
-                file_types = set(discovered_types[:5])  # Fallback
-                print(f"🎯 Using default selection: {', '.join(sorted(file_types))}")
-    
-    selected_files = set(included_files or [])
-    ignored_directories = set(ignored_dirs or [])
-    selected_dirs = set(included_dirs or [start_path])
-    
-    while True:
-        print("\n📋 Current Configuration:")
-        print(f"  Start Path: {start_path}")
-        print(f"  File Types: {', '.join(sorted(file_types)) if file_types else 'All files'}")
-        print(f"  Selected Files: {len(selected_files)} files")
-        print(f"  Ignored Dirs: {len(ignored_directories)} directories")
-        print(f"  Selected Dirs: {', '.join(selected_dirs)}")
-        
-        print("\n📝 Options:")
-        print("  1. Add file extensions")
-        print("  2. Remove file extensions") 
-        print("  3. Quick-select common types (py,js,md,txt)")
-        print("  4. Select from discovered types")
-        print("  5. Add specific files")
-        print("  6. Remove specific files")
-        print("  7. Add ignored directories")
-        print("  8. Remove ignored directories")
-        print("  9. Preview selected files")
-        print("  0. Use current selection")
-        print("  q. Cancel")
+            print("❌ No file types discovered")
         
-        try:
-            choice = input("\n❓ Choose option: ").strip().lower()
-            
-            if choice == '1':
-                extensions = input("📝 Enter file extensions (comma-separated, no dots): ").strip()
-                if extensions:
-                    new_exts = [f".{ext.strip().lstrip('.')}" for ext in extensions.split(',') if ext.strip()]
-                    file_types.update(new_exts)
-                    print(f"✅ Added extensions: {', '.join(new_exts)}")
-            
-            elif choice == '2':
-                if file_types:
-                    print("Current extensions:", ', '.join(sorted(file_types)))
-                    ext_to_remove = input("📝 Enter extension to remove: ").strip()
-                    if ext_to_remove:
-                        if not ext_to_remove.startswith('.'):
-                            ext_to_remove = '.' + ext_to_remove
-                        if ext_to_remove in file_types:
-                            file_types.remove(ext_to_remove)
-                            print(f"✅ Removed extension: {ext_to_remove}")
-                        else:
-                            print(f"❌ Extension not found: {ext_to_remove}")
-                else:
-                    print("❌ No extensions to remove")
-            
-            elif choice == '3':
-                common_types = {'.py', '.js', '.ts', '.md', '.txt', '.json', '.yml', '.css', '.html'}
-                available_common = [ext for ext in common_types if ext in discovered_types]
-                if available_common:
-                    file_types.update(available_common)
-                    print(f"✅ Added common types: {', '.join(sorted(available_common))}")
-                else:
-                    print("❌ No common code types found in directory")
+        # Initialize with discovery or preselected
+        if preselected_filters:
+            file_types = set(preselected_filters)
+            print(f"\n🎯 Using preselected filters: {', '.join(file_types)}")
+        else:
+            # Auto-select common code types
+            auto_selected = [ext for ext in discovered_types if ext in _COMMON_CODE_TYPES]
             
-            elif choice == '4':
+            if auto_selected:
+                file_types = set(auto_selected)
+                print(f"\n🎯 Auto-selected common code types: {', '.join(sorted(file_types))}")
+            else:
+                # Offer to select from discovered types
+                file_types = set()
+                print(f"\n🤔 No common code types found. Select from discovered types:")
                 if discovered_types:
-                    print("\n📋 Discovered file types:")
-                    for i, ext in enumerate(discovered_types, 1):
-                        indicator = "✓" if ext in file_types else " "
-                        print(f"  {indicator} {i:2d}. {ext}")
-                    
-                    print("\nEnter numbers to toggle (comma-separated):")
+                    print("Enter numbers (comma-separated) or 'all' for all types:")
                     try:
-                        numbers_input = input("❓ Numbers: ").strip()
-                        if numbers_input:
-                            numbers = [int(x.strip()) for x in numbers_input.split(',') if x.strip().isdigit()]
-                            for num in numbers:
-                                if 1 <= num <= len(discovered_types):
-                                    ext = discovered_types[num-1]
-                                    if ext in file_types:
-                                        file_types.remove(ext)
-                                        print(f"➖ Removed: {ext}")
-                                    else:
-                                        file_types.add(ext)
-                                        print(f"➕ Added: {ext}")
-                    except ValueError:
-                        print("❌ Please enter valid numbers")
-                else:
-                    print("❌ No file types discovered")
+                        choice = input("❓ Your choice: ").strip().lower()
+                        if choice == 'all':
+                            file_types = set(discovered_types)
+                        elif choice:
+                            numbers = [int(x.strip()) for x in choice.split(',') if x.strip().isdigit()]
+                            file_types = {discovered_types[i-1] for i in numbers if 1 <= i <= len(discovered_types)}
+                    except (ValueError, IndexError, KeyboardInterrupt):
+                        file_types = set(discovered_types[:5])  # Default to first 5
+                
+                if not file_types:
+                    file_types = set(discovered_types[:5])  # Fallback
+                    print(f"🎯 Using default selection: {', '.join(sorted(file_types))}")
+        
+        selected_files = set(included_files or [])
+        ignored_directories = set(ignored_dirs or [])
+        selected_dirs = set(included_dirs or [start_path])
+        
+        while True:
+            print("\n📋 Current Configuration:")
+            print(f"  Start Path: {start_path}")
+            print(f"  File Types: {', '.join(sorted(file_types)) if file_types else 'All files'}")
+            print(f"  Selected Files: {len(selected_files)} files")
+            print(f"  Ignored Dirs: {len(ignored_directories)} directories")
+            print(f"  Selected Dirs: {', '.join(selected_dirs)}")
             
-            elif choice == '5':
-                files = input("📝 Enter file paths (comma-separated): ").strip()
-                if files:
-                    new_files = [f.strip() for f in files.split(',') if f.strip()]
-                    # Validate files exist
-                    valid_files = []
-                    for file_path in new_files:
-                        if Path(file_path).exists():
-                            valid_files.append(file_path)
-                        else:
-                            print(f"⚠️  File not found: {file_path}")
-                    
-                    if valid_files:
-                        selected_files.update(valid_files)
-                        print(f"✅ Added files: {', '.join(valid_files)}")
+            print("\n📝 Options:")
+            print("  1. Add file extensions")
+            print("  2. Remove file extensions") 
+            print("  3. Quick-select common types (py,js,md,txt)")
+            print("  4. Select from discovered types")
+            print("  5. Add specific files")
+            print("  6. Remove specific files")
+            print("  7. Add ignored directories")
+            print("  8. Remove ignored directories")
+            print("  9. Preview selected files")
+            print("  0. Use current selection")
+            print("  q. Cancel")
             
-            elif choice == '6':
-                if selected_files:
-                    print("Current files:")
-                    for i, file_path in enumerate(selected_files, 1):
-                        print(f"  {i}. {file_path}")
-                    
-                    try:
-                        file_num = int(input("📝 Enter file number to remove: ").strip())
-                        file_list = list(selected_files)
-                        if 1 <= file_num <= len(file_list):
-                            removed_file = file_list[file_num - 1]
-                            selected_files.remove(removed_file)
-                            print(f"✅ Removed file: {removed_file}")
-                        else:
-                            print("❌ Invalid file number")
-                    except ValueError:
-                        print("❌ Please enter a valid number")
+            try:
+                choice = input("\n❓ Choose option: ").strip().lower()
+                
+                if choice == '1':
+                    extensions = input("📝 Enter file extensions (comma-separated, no dots): ").strip()
+                    if extensions:
+                        new_exts = [f".{ext.strip().lstrip('.')}" for ext in extensions.split(',') if ext.strip()]
+                        file_types.update(new_exts)
+                        print(f"✅ Added extensions: {', '.join(new_exts)}")
+                
+                elif choice == '2':
+                    if file_types:
+                        print("Current extensions:", ', '.join(sorted(file_types)))
+                        ext_to_remove = input("📝 Enter extension to remove: ").strip()
+                        if ext_to_remove:
+                            if not ext_to_remove.startswith('.'):
+                                ext_to_remove = '.' + ext_to_remove
+                            if ext_to_remove in file_types:
+                                file_types.remove(ext_to_remove)
+                                print(f"✅ Removed extension: {ext_to_remove}")
+                            else:
+                                print(f"❌ Extension not found: {ext_to_remove}")
+                    else:
+                        print("❌ No extensions to remove")
+                
+                elif choice == '3':
+                    available_common = _COMMON_QUICK_TYPES.intersection(discovered_types)
+                    if available_common:
+                        file_types.update(available_common)
+                        print(f"✅ Added common types: {', '.join(sorted(available_common))}")
+                    else:
+                        print("❌ No common code types found in directory")
+                
+                elif choice == '4':
+                    if discovered_types:
+                        print("\n📋 Discovered file types:")
+                        for i, ext in enumerate(discovered_types, 1):
+                            indicator = "✓" if ext in file_types else " "
+                            print(f"  {indicator} {i:2d}. {ext}")
+                        
+                        print("\nEnter numbers to toggle (comma-separated):")
+                        try:
+                            numbers_input = input("❓ Numbers: ").strip()
+                            if numbers_input:
+                                numbers = [int(x.strip()) for x in numbers_input.split(',') if x.strip().isdigit()]
+                                for num in numbers:
+                                    if 1 <= num <= len(discovered_types):
+                                        ext = discovered_types[num-1]
+                                        if ext in file_types:
+                                            file_types.remove(ext)
+                                            print(f"➖ Removed: {ext}")
+                                        else:
+                                            file_types.add(ext)
+                                            print(f"➕ Added: {ext}")
+                        except ValueError:
+                            print("❌ Please enter valid numbers")
+                    else:
+                        print("❌ No file types discovered")
+                
+                elif choice == '5':
+                    files = input("📝 Enter file paths (comma-separated): ").strip()
+                    if files:
+                        new_files = [f.strip() for f in files.split(',') if f.strip()]
+                        # Validate files exist
+                        valid_files = []
+                        for file_path in new_files:
+                            if Path(file_path).exists():
+                                valid_files.append(file_path)
+                            else:
+                                print(f"⚠️  File not found: {file_path}")
+                        
+                        if valid_files:
+                            selected_files.update(valid_files)
+                            print(f"✅ Added files: {', '.join(valid_files)}")
+                
+                elif choice == '6':
+                    if selected_files:
+                        print("Current files:")
+                        for i, file_path in enumerate(selected_files, 1):
+                            print(f"  {i}. {file_path}")
+                        
+                        try:
+                            file_num = int(input("📝 Enter file number to remove: ").strip())
+                            file_list = list(selected_files)
+                            if 1 <= file_num <= len(file_list):
+                                removed_file = file_list[file_num - 1]
+                                selected_files.remove(removed_file)
+                                print(f"✅ Removed file: {removed_file}")
+                            else:
+                                print("❌ Invalid file number")
+                        except ValueError:
+                            print("❌ Please enter a valid number")
+                    else:
+                        print("❌ No files to remove")
+                
+                elif choice == '7':
+                    dirs = input("📝 Enter directories to ignore (comma-separated): ").strip()
+                    if dirs:
+                        new_dirs = [d.strip() for d in dirs.split(',') if d.strip()]
+                        ignored_directories.update(new_dirs)
+                        print(f"✅ Added ignored directories: {', '.join(new_dirs)}")
+                
+                elif choice == '8':
+                    if ignored_directories:
+                        print("Current ignored directories:")
+                        for i, dir_path in enumerate(ignored_directories, 1):
+                            print(f"  {i}. {dir_path}")
+                        
+                        try:
+                            dir_num = int(input("📝 Enter directory number to remove: ").strip())
+                            dir_list = list(ignored_directories)
+                            if 1 <= dir_num <= len(dir_list):
+                                removed_dir = dir_list[dir_num - 1]
+                                ignored_directories.remove(removed_dir)
+                                print(f"✅ Removed ignored directory: {removed_dir}")
+                            else:
+                                print("❌ Invalid directory number")
+                        except ValueError:
+                            print("❌ Please enter a valid number")
+                    else:
+                        print("❌ No ignored directories to remove")
+                
+                elif choice == '9':
+                    print("\n🔍 Preview of Selected Files:")
+                    preview_files(start_path, file_types, selected_files, ignored_directories)
+                
+                elif choice == '0':
+                    print("✅ Using current selection")
+                    break
+                
+                elif choice == 'q':
+                    print("❌ Selection cancelled")
+                    return None
+                
                 else:
-                    print("❌ No files to remove")
-            
-            elif choice == '7':
-                dirs = input("📝 Enter directories to ignore (comma-separated): ").strip()
-                if dirs:
-                    new_dirs = [d.strip() for d in dirs.split(',') if d.strip()]
-                    ignored_directories.update(new_dirs)
-                    print(f"✅ Added ignored directories: {', '.join(new_dirs)}")
-            
-            elif choice == '8':
-                if ignored_directories:
-                    print("Current ignored directories:")
-                    for i, dir_path in enumerate(ignored_directories, 1):
-                        print(f"  {i}. {dir_path}")
+                    print("❌ Invalid choice. Please try again.")
                     
-                    try:
-                        dir_num = int(input("📝 Enter directory number to remove: ").strip())
-                        dir_list = list(ignored_directories)
-                        if 1 <= dir_num <= len(dir_list):
-                            removed_dir = dir_list[dir_num - 1]
-                            ignored_directories.remove(removed_dir)
-                            print(f"✅ Removed ignored directory: {removed_dir}")
-                        else:
-                            print("❌ Invalid directory number")
-                    except ValueError:
-                        print("❌ Please enter a valid number")
-                else:
-                    print("❌ No ignored directories to remove")
-            
-            elif choice == '9':
-                print("\n🔍 Preview of Selected Files:")
-                preview_files(start_path, file_types, selected_files, ignored_directories)
-            
-            elif choice == '0':
-                print("✅ Using current selection")
-                break
-            
-            elif choice == 'q':
-                print("❌ Selection cancelled")
+            except KeyboardInterrupt:
+                print("\n❌ Selection cancelled")
                 return None
-            
-            else:
-                print("❌ Invalid choice. Please try again.")
-                
-        except KeyboardInterrupt:
-            print("\n❌ Selection cancelled")
-            return None
-        except EOFError:
-            print("\n❌ Selection cancelled")
-            return None
+            except EOFError:
+                print("\n❌ Selection cancelled")
+                return None
+    finally:
+        # Drop this session's file listing however the menu is left
+        _scan_cache.clear()
     
     # Return results in the same format as curses selector
     return {
@@ -258,21 +275,10 @@ def simple_select_files(
     }
 
 
-def discover_file_types_simple(path: str) -> List[str]:
-    """Discover all file types in the given path."""
-    extensions = set()
-    try:
-        for file_path in Path(path).rglob("*"):
-            if file_path.is_file():
-                try:
-                    file_path.stat()  # Check accessibility
-                    ext = file_path.suffix.lower()
-                    if ext:
-                        extensions.add(ext)
-                except (PermissionError, OSError):
-                    continue
-    except (PermissionError, OSError):
-        pass
+def discover_file_types_simple(path: str, ignored_dirs: Optional[List[str]] = None) -> List[str]:
+    """Discover all file types in the given path, outside any ignored directories."""
+    extensions = {suffix for _, suffix in _scan(path, ignored_dirs or ())}
+    extensions.discard('')
     return sorted(extensions)
     
     while True:
@@ -412,6 +418,75 @@ def discover_file_types_simple(path: str) -> List[str]:
     }
 
 
+def _scan(start_path: str, ignored_dirs: Iterable[str] = ()) -> List[Tuple[str, str]]:
+    """
+    Return (path, lowercase suffix) for every file below start_path that is
+    not inside one of ignored_dirs.
+    
+    The walk is done once and reused by later calls (discovery, then each
+    preview) for the rest of the selector session, or until the start
+    directory's own mtime or the ignored set changes. Files added or removed
+    in subdirectories do not change that mtime, so they are only picked up
+    by the next session.
+    """
+    ignored_prefixes = _ignored_prefixes(ignored_dirs)
+    try:
+        key = (start_path, os.stat(start_path).st_mtime_ns, frozenset(ignored_prefixes))
+    except OSError:
+        return []
+    files = _scan_cache.get(key)
+    if files is None:
+        files = _scan_cache[key] = list(_walk(start_path, ignored_prefixes))
+    return files
+
+
+def _ignored_prefixes(ignored_dirs: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Resolve ignored directories to path prefixes.
+    
+    The trailing separator limits each to its own subtree ("build" does
+    not also hide "build2").
+    """
+    return tuple(os.path.join(str(Path(ignore_dir).resolve()), '') for ignore_dir in ignored_dirs)
+
+
+def _walk(start_path: str, ignored_prefixes: Tuple[str, ...] = ()) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (path, lowercase suffix) for every file below start_path.
+    
+    Walks with os.scandir and an explicit stack: entry types come from the
+    directory listing, so there is no Path object or stat call per file.
+    Symlinked directories are not descended into, as with rglob("*").
+    Directories whose real path falls under ignored_prefixes are skipped
+    without being read.
+    """
+    root = os.fspath(Path(start_path))
+    # (path as reported, real path for matching against ignored_prefixes);
+    # only the root can be a symlink, since symlinked directories are not
+    # descended into, so children's real paths are built by joining names
+    stack = [(root, os.path.realpath(root))]
+    while stack:
+        dir_path, real_path = stack.pop()
+        if os.path.join(real_path, '').startswith(ignored_prefixes):
+            continue
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, os.path.join(real_path, entry.name)))
+                        elif entry.is_file():
+                            # Same rule as Path.suffix
+                            name = entry.name
+                            i = name.rfind('.')
+                            suffix = name[i:].lower() if 0 < i < len(name) - 1 else ''
+                            yield entry.path, suffix
+                    except OSError:
+                        continue
+        except (PermissionError, OSError):
+            continue
+
+
 def preview_files(
     start_path: str, 
     file_types: Set[str], 
@@ -436,32 +511,22 @@ def preview_files(
     matching_files = []
     
     try:
-        # Scan for matching files
-        for file_path in base_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-            
-            # Check if in ignored directory
-            skip = False
-            for ignore_dir in ignored_dirs:
-                if str(file_path).startswith(str(Path(ignore_dir).resolve())):
-                    skip = True
-                    break
-            
-            if skip:
-                continue
-            
-            # Check if matches file types or is specifically selected
-            if (file_path.suffix.lower() in file_types or 
-                str(file_path) in selected_files or
-                not file_types):  # Include all if no types specified
-                matching_files.append(file_path)
+        # Scan for matching files outside ignored directories, reusing the
+        # walk made for discovery when nothing has changed
+        # The walk already holds each file's lowercase suffix, so filtering
+        # is one set lookup and only matching files become Path objects
+        for path_str, suffix in _scan(start_path, ignored_dirs):
+            # Check if matches file types (include all if no types specified)
+            if not file_types or suffix in file_types:
+                matching_files.append(Path(path_str))
         
-        # Add specifically selected files
+        # Add specifically selected files, wherever they are
+        seen = set(matching_files)
         for file_str in selected_files:
             file_path = Path(file_str)
-            if file_path.exists() and file_path not in matching_files:
+            if file_path not in seen and file_path.exists():
                 matching_files.append(file_path)
+                seen.add(file_path)
         
         # Display results
         if matching_files:
@@ -17,8 +17,9 @@ filtering operations in a consistent and predictable order.
 from pathlib import Path
 import logging
 import os
+import re
 import fnmatch
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import List, Dict, Any, Set, FrozenSet, Optional, Pattern, Tuple
 
 from .utils import is_binary_file, validate_file_path
 
@@ -56,6 +57,8 @@ class FileFilter:
         self.exclude_extensions = self._normalize_extensions(exclude_extensions or [])
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        self._include_regex = self._compile_patterns(self.include_patterns)
+        self._exclude_regex = self._compile_patterns(self.exclude_patterns)
         self.include_all = include_all
         self.include_hidden = include_hidden
         self.include_binary = include_binary
@@ -70,7 +73,7 @@ class FileFilter:
         logging.debug(f"  Include hidden: {self.include_hidden}")
         logging.debug(f"  Include binary: {self.include_binary}")
     
-    def _normalize_extensions(self, extensions: List[str]) -> Set[str]:
+    def _normalize_extensions(self, extensions: List[str]) -> FrozenSet[str]:
         """Normalize extensions to always include the dot prefix."""
         normalized = set()
         for ext in extensions:
@@ -79,7 +82,33 @@ class FileFilter:
                 ext = '.' + ext
             if ext:
                 normalized.add(ext.lower())
-        return normalized
+        return frozenset(normalized)
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> Optional[Pattern]:
+        """
+        Compile glob patterns into a single regex with fnmatch semantics.
+        
+        One regex search per file replaces a Python-level fnmatch call per
+        pattern; the individual pattern is only looked up when one matches.
+        """
+        if not patterns:
+            return None
+        return re.compile('|'.join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+        ))
+    
+    def _matching_pattern(self, name: str, regex: Optional[Pattern], patterns: List[str]) -> Optional[str]:
+        """Return the first pattern matching a file name, or None."""
+        if regex is None:
+            return None
+        name = os.path.normcase(name)
+        if not regex.match(name):
+            return None
+        for pattern in patterns:
+            if fnmatch.fnmatch(name, pattern):
+                return pattern
+        return None
     
     def should_ignore_directory(self, dir_path: Path) -> bool:
         """
@@ -131,9 +160,9 @@ class FileFilter:
             
             # Check exclude patterns first (they take precedence)
             # Only check the filename, not the full path to avoid matching temp directories
-            for pattern in self.exclude_patterns:
-                if fnmatch.fnmatch(file_path.name, pattern):
-                    return False, f"matches exclude pattern '{pattern}'"
+            pattern = self._matching_pattern(file_path.name, self._exclude_regex, self.exclude_patterns)
+            if pattern is not None:
+                return False, f"matches exclude pattern '{pattern}'"
             
             # Check exclude extensions
             if file_path.suffix.lower() in self.exclude_extensions:
@@ -147,11 +176,10 @@ class FileFilter:
                 return True, "include_all enabled"
             
             # Check include patterns (only check filename, not full path)
-            pattern_match = False
-            for pattern in self.include_patterns:
-                if fnmatch.fnmatch(file_path.name, pattern):
-                    pattern_match = True
-                    break
+            pattern_match = (
+                self._include_regex is not None and
+                self._include_regex.match(os.path.normcase(file_path.name)) is not None
+            )
             
             # Check include extensions
             extension_match = file_path.suffix.lower() in self.include_extensions
@@ -258,12 +286,13 @@ def get_paths(
         base_dir = Path(directories[0]).resolve() if directories else Path.cwd()
         all_paths = add_specific_files(all_paths, include_files, base_dir)
     
-    # Step 4: Remove duplicates while preserving order
+    # Step 4: Remove duplicates while preserving order. Every producer above
+    # stores resolved absolute paths, so the path string is already the key.
     seen_paths = set()
     deduplicated_paths = []
     
     for item in all_paths:
-        path_key = str(item["path"].resolve())
+        path_key = str(item["path"])
         if path_key not in seen_paths:
             seen_paths.add(path_key)
             deduplicated_paths.append(item)
@@ -271,10 +300,10 @@ def get_paths(
     # Step 5: Final sort by relative path
     deduplicated_paths.sort(key=lambda x: (x["type"] == "file", x["relative_path"]))
     
-    file_count = len([p for p in deduplicated_paths if p["type"] == "file"])
-    dir_count = len([p for p in deduplicated_paths if p["type"] == "dir"])
-    
-    logging.info(f"Final result: {file_count} files, {dir_count} directories")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        file_count = sum(1 for p in deduplicated_paths if p["type"] == "file")
+        logging.info("Final result: %d files, %d directories",
+                     file_count, len(deduplicated_paths) - file_count)
     
     return deduplicated_paths
 
@@ -326,8 +355,10 @@ def scan_directories(
     # Sort by relative path for consistent output
     all_paths.sort(key=lambda x: x["relative_path"])
 
-    logging.info(f"Found {len([p for p in all_paths if p['type'] == 'file'])} files and "
-                f"{len([p for p in all_paths if p['type'] == 'dir'])} directories")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        file_count = sum(1 for p in all_paths if p["type"] == "file")
+        logging.info("Found %d files and %d directories",
+                     file_count, len(all_paths) - file_count)
 
     return all_paths
 
@@ -350,9 +381,8 @@ def _scan_directory_recursive(
     if max_depth is not None and current_depth > max_depth:
         return paths
 
-    # ALWAYS work with absolute paths
-    current_path = current_path.resolve()
-    base_path = base_path.resolve()
+    # Callers pass resolved paths; entries below are derived from them
+    # without further resolve() calls unless they are symlinks
 
     # Calculate relative path for display
     try:
@@ -374,6 +404,9 @@ def _scan_directory_recursive(
         "type": "dir"
     })
 
+    # Plain children extend this directory's relative path
+    child_prefix = "" if current_path == base_path else relative_path + os.sep
+
     try:
         # Get directory contents
         with os.scandir(current_path) as entries:
@@ -381,23 +414,29 @@ def _scan_directory_recursive(
             sorted_entries = sorted(entries, key=lambda e: (e.is_file(), e.name.lower()))
 
             for entry in sorted_entries:
-                try:
-                    entry_path = Path(entry.path).resolve()  # ALWAYS resolve to absolute
-                except Exception as e:
-                    logging.warning(f"Could not resolve path {entry.path}: {e}")
-                    continue
+                # current_path is already absolute and resolved, so only
+                # symlinks need a resolve() round-trip through the filesystem
+                if entry.is_symlink():
+                    try:
+                        entry_path = Path(entry.path).resolve()
+                    except Exception as e:
+                        logging.warning(f"Could not resolve path {entry.path}: {e}")
+                        continue
+                    
+                    # The target can be anywhere, so calculate its relative path
+                    try:
+                        entry_relative = str(entry_path.relative_to(base_path))
+                    except ValueError:
+                        entry_relative = str(entry_path)
+                else:
+                    entry_path = current_path / entry.name
+                    entry_relative = child_prefix + entry.name
 
                 # Skip if already processed
                 entry_key = str(entry_path)
                 if entry_key in processed_paths:
                     continue
 
-                # Calculate relative path for entry
-                try:
-                    entry_relative = str(entry_path.relative_to(base_path))
-                except ValueError:
-                    entry_relative = str(entry_path)
-
                 if entry.is_dir():
                     # Check if directory should be ignored
                     if not file_filter.should_ignore_directory(entry_path):
@@ -420,12 +459,16 @@ def _scan_directory_recursive(
 
                     if should_include:
                         processed_paths.add(entry_key)
-                        paths.append({
+                        item = {
                             "path": entry_path,  # ABSOLUTE PATH
                             "relative_path": entry_relative,
                             "depth": current_depth + 1,
                             "type": "file"
-                        })
+                        }
+                        if not file_filter.include_binary:
+                            # The filter has already run is_binary_file on it
+                            item["is_binary"] = False
+                        paths.append(item)
                         logging.debug(f"Including file: {entry_path} ({reason})")
                     else:
                         logging.debug(f"Excluding file: {entry_path} ({reason})")
@@ -602,12 +645,16 @@ def apply_glob_patterns(
                     except ValueError:
                         relative_path = str(file_path)
 
-                    matching_files.append({
+                    item = {
                         "path": file_path,  # ABSOLUTE PATH
                         "relative_path": relative_path,
                         "depth": len(file_path.parts) - len(base_path.parts),
                         "type": "file"
-                    })
+                    }
+                    if not file_filter.include_binary:
+                        # The filter has already run is_binary_file on it
+                        item["is_binary"] = False
+                    matching_files.append(item)
 
                     processed_paths.add(path_key)
                     logging.debug(f"Added glob match: {file_path}")
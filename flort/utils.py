@@ -15,15 +15,31 @@ while handling errors gracefully and providing appropriate logging.
 
 import os
 import re
+import stat
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 import zipfile
 import tarfile
 import logging
 
 
+# Extensions is_binary_file treats as binary without reading the file
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.obj', '.o', '.a', '.lib',
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg', '.webp',
+    '.mp3', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.wav',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.pyc', '.pyo', '.pyd', '.class', '.jar'
+})
+
+# Bytes that count as text when is_binary_file measures a file's head
+_TEXT_CHARACTERS = bytes(range(32, 127)) + b'\n\r\t\f\b'
+
+
 def is_binary_file(file_path: Path) -> bool:
     """
     Determine if a file is binary by examining its contents.
@@ -46,16 +62,7 @@ def is_binary_file(file_path: Path) -> bool:
     """
     try:
         # Check common binary extensions first
-        binary_extensions = {
-            '.exe', '.dll', '.so', '.dylib', '.bin', '.obj', '.o', '.a', '.lib',
-            '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg', '.webp',
-            '.mp3', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.wav',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.pyc', '.pyo', '.pyd', '.class', '.jar'
-        }
-        
-        if file_path.suffix.lower() in binary_extensions:
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
             return True
             
         # Check file content
@@ -71,8 +78,7 @@ def is_binary_file(file_path: Path) -> bool:
                 return True
                 
             # Check for high percentage of non-text characters
-            text_characters = bytes(range(32, 127)) + b'\n\r\t\f\b'
-            non_text_count = len(chunk.translate(None, text_characters))
+            non_text_count = len(chunk.translate(None, _TEXT_CHARACTERS))
             
             # If more than 30% non-text characters, consider binary
             return (non_text_count / len(chunk)) > 0.3
@@ -92,8 +98,29 @@ def clean_content(file_path: Path) -> str:
     Returns:
         str: Cleaned content with normalized whitespace
 
+    Reads the file and applies clean_text(); see there for the rules.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+            return clean_text(file.read())
+        
+    except Exception as e:
+        logging.error(f"Error cleaning content from {file_path}: {e}")
+        return ""
+
+
+def clean_text(content: str) -> str:
+    """
+    Clean up text by removing unnecessary whitespace while preserving structure.
+
+    Args:
+        content (str): Text to clean
+
+    Returns:
+        str: Cleaned content with normalized whitespace
+
     The function:
-    1. Reads all lines from the file
+    1. Splits the text into lines
     2. Preserves leading whitespace for indentation
     3. Strips trailing whitespace only
     4. Preserves empty lines that separate code blocks
@@ -104,35 +131,27 @@ def clean_content(file_path: Path) -> str:
         - Removes trailing whitespace
         - Limits consecutive empty lines to 2
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-            lines = file.readlines()
-            
-        cleaned_lines = []
-        consecutive_empty = 0
+    cleaned_lines = []
+    consecutive_empty = 0
+    
+    for line in content.split('\n'):
+        # Strip only trailing whitespace, preserve leading
+        cleaned_line = line.rstrip()
         
-        for line in lines:
-            # Strip only trailing whitespace, preserve leading
-            cleaned_line = line.rstrip()
-            
-            if not cleaned_line:
-                consecutive_empty += 1
-                # Allow max 2 consecutive empty lines
-                if consecutive_empty <= 2:
-                    cleaned_lines.append('')
-            else:
-                consecutive_empty = 0
-                cleaned_lines.append(cleaned_line)
-                
-        # Remove trailing empty lines
-        while cleaned_lines and not cleaned_lines[-1]:
-            cleaned_lines.pop()
+        if not cleaned_line:
+            consecutive_empty += 1
+            # Allow max 2 consecutive empty lines
+            if consecutive_empty <= 2:
+                cleaned_lines.append('')
+        else:
+            consecutive_empty = 0
+            cleaned_lines.append(cleaned_line)
             
-        return '\n'.join(cleaned_lines)
+    # Remove trailing empty lines
+    while cleaned_lines and not cleaned_lines[-1]:
+        cleaned_lines.pop()
         
-    except Exception as e:
-        logging.error(f"Error cleaning content from {file_path}: {e}")
-        return ""
+    return '\n'.join(cleaned_lines)
 
 
 def write_file(file_path: str, data: str, mode: str = 'a') -> bool:
@@ -165,6 +184,14 @@ def write_file(file_path: str, data: str, mode: str = 'a') -> bool:
         if file_path == "stdio":
             print(data, end='')
             return True
+        elif file_path in _open_outputs:
+            # Reuse the handle held open by output_session()
+            handle = _open_outputs[file_path]
+            if mode == 'w':
+                handle.seek(0)
+                handle.truncate()
+            handle.write(data)
+            return True
         else:
             # Create parent directories if they don't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
@@ -184,6 +211,54 @@ def write_file(file_path: str, data: str, mode: str = 'a') -> bool:
         return False
 
 
+# Output files held open by output_session(), keyed by the path passed to write_file
+_open_outputs: Dict[str, Any] = {}
+
+
+@contextmanager
+def output_session(file_path: str, buffer_size: int = 1 << 20, mode: str = 'w') -> Iterator[None]:
+    """
+    Keep an output file open so consecutive write_file calls share one handle.
+
+    Args:
+        file_path (str): Path to output file or "stdio" for console output
+        buffer_size (int, optional): Write buffer size in bytes. Defaults to 1 MiB.
+        mode (str, optional): File opening mode ('w' to create, 'a' to append to
+            what is already there). Defaults to 'w'.
+
+    Within the session every write_file(file_path, ...) call writes through a
+    single buffered handle instead of reopening the file per section. With the
+    default mode the file is created (truncated) when the session starts; it is
+    closed when the session ends, so readers such as count_file_tokens should
+    run after the session exits.
+
+    Note:
+        - "stdio" output needs no handle and the session is a no-op
+        - If the file cannot be opened, write_file falls back to per-call opens
+        - Nested sessions for the same path reuse the outer handle
+    """
+    if file_path == "stdio" or file_path in _open_outputs:
+        yield
+        return
+
+    try:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        handle = open(file_path, mode, encoding='utf-8', buffering=buffer_size)
+    except OSError as e:
+        # Fall back to per-call writes, which report their own errors
+        logging.error(f"Failed to open output file {file_path}: {e}")
+        yield
+        return
+
+    _open_outputs[file_path] = handle
+    try:
+        yield
+    finally:
+        del _open_outputs[file_path]
+        handle.close()
+        logging.debug(f"Output session closed: {file_path}")
+
+
 def configure_logging(verbose: bool) -> None:
     """
     Configure the logging system based on the verbosity level.
@@ -203,6 +278,19 @@ def configure_logging(verbose: bool) -> None:
     )
 
 
+# Token pattern for count_tokens, compiled once. Whitespace has no alternative:
+# findall skips characters that match nothing, so only real tokens are returned.
+_TOKEN_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\b[A-Za-z_][A-Za-z0-9_]*\b',  # Identifiers/words
+    r'\b\d+\.?\d*%?\b',             # Numbers and percentages
+    r'[+\-*/=<>!&|^~]+=?',          # Operators
+    r'[(){}\[\]]',                   # Brackets
+    r'[.,;:]',                       # Punctuation
+    r'[\'"`]',                       # Quotes
+    r'[@#$%\\]',                     # Special symbols
+)))
+
+
 def count_tokens(text: str) -> int:
     """
     Count tokens in text using a robust tokenization strategy.
@@ -222,31 +310,8 @@ def count_tokens(text: str) -> int:
     """
     if not text:
         return 0
-        
-    # Enhanced pattern for better code tokenization
-    patterns = [
-        r'\b[A-Za-z_][A-Za-z0-9_]*\b',  # Identifiers/words
-        r'\b\d+\.?\d*%?\b',             # Numbers and percentages
-        r'[+\-*/=<>!&|^~]+=?',          # Operators
-        r'[(){}\[\]]',                   # Brackets
-        r'[.,;:]',                       # Punctuation
-        r'[\'"`]',                       # Quotes
-        r'[@#$%\\]',                     # Special symbols
-        r'\s+',                          # Whitespace (will be filtered)
-    ]
-    
-    combined_pattern = '|'.join(f'({pattern})' for pattern in patterns)
-    tokens = re.findall(combined_pattern, text)
     
-    # Filter out whitespace tokens and count non-empty matches
-    non_whitespace_tokens = []
-    for token_groups in tokens:
-        for token in token_groups:
-            if token and not token.isspace():
-                non_whitespace_tokens.append(token)
-                break
-    
-    return len(non_whitespace_tokens)
+    return len(_TOKEN_PATTERN.findall(text))
 
 
 def count_file_tokens(filename: str) -> str:
@@ -506,10 +571,17 @@ def validate_file_path(file_path: Path) -> Tuple[bool, str]:
         tuple[bool, str]: (is_valid, error_message)
     """
     try:
-        if not file_path.exists():
+        # One stat() answers both the existence and the regular-file check
+        try:
+            file_stat = file_path.stat()
+        except PermissionError:
+            raise
+        except OSError:
+            # Missing, symlink loop, etc.: everything Path.exists() reported
+            # as not existing
             return False, "File does not exist"
             
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return False, "Path is not a file"
             
         # Test readability
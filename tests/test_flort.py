@@ -26,11 +26,12 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from flort.utils import (
-    is_binary_file, clean_content, write_file, count_tokens, 
-    validate_file_path, sanitize_output_path
+    is_binary_file, clean_content, clean_text, write_file, count_tokens, 
+    validate_file_path, sanitize_output_path, output_session
 )
 from flort.traverse import FileFilter, scan_directories, get_paths, add_specific_files
 from flort.concatenate_files import FileConcatenator, concat_files, create_file_manifest
+from flort.python_outline import analyze_python_file, python_outline_files
 from flort.cli import parse_comma_separated_list, parse_ignore_dirs, validate_arguments
 from flort.validation import ValidationError
 
@@ -85,6 +86,9 @@ def world():
         # Should preserve function separation with double newlines
         assert 'def hello():' in cleaned
         assert 'def world():' in cleaned
+        
+        # The in-memory variant gives the same result without touching disk
+        assert clean_text(content) == cleaned
     
     def test_count_tokens(self):
         """Test token counting functionality."""
@@ -140,6 +144,27 @@ def world():
         assert result == absolute.resolve()
 
 
+    def test_output_session(self, tmp_path):
+        """Test that write_file reuses the handle held by output_session."""
+        output_file = tmp_path / "out" / "session.txt"
+        output_file.parent.mkdir()
+        output_file.write_text("stale content")
+        
+        with output_session(str(output_file)):
+            assert write_file(str(output_file), "header\n", 'w')
+            assert write_file(str(output_file), "body\n")
+        
+        assert output_file.read_text() == "header\nbody\n"
+        
+        # Writes after the session fall back to reopening the file
+        assert write_file(str(output_file), "tail\n")
+        assert output_file.read_text() == "header\nbody\ntail\n"
+
+        # Append sessions keep what is already there
+        with output_session(str(output_file), mode='a'):
+            assert write_file(str(output_file), "more\n")
+        assert output_file.read_text() == "header\nbody\ntail\nmore\n"
+
 
 class TestFileFilter:
     """Test suite for FileFilter class."""
@@ -382,7 +407,30 @@ class TestConcatenation:
         assert "## File Data" in content
         assert "test.py" in content
         assert "print('hello world')" in content
-    
+        assert "--- Token Count: 7" in content
+
+        # Token counting can be switched off
+        output_file.unlink()
+        assert concat_files(file_list, str(output_file), count_tokens=False)
+        content = output_file.read_text()
+        assert "--- Token Count: (disabled)" in content
+        assert "print('hello world')" in content
+
+    def test_concat_files_keeps_order(self, tmp_path):
+        """Test that files read ahead in parallel are written in list order."""
+        file_list = []
+        for i in range(150):
+            path = tmp_path / f"mod_{i:03d}.py"
+            path.write_text(f"value = {i}\n" * (i % 7 + 1))
+            file_list.append({"path": path, "relative_path": path.name, "type": "file"})
+
+        output_file = tmp_path / "output.txt"
+        assert concat_files(list(reversed(file_list)), str(output_file))
+
+        headers = [line for line in output_file.read_text().splitlines()
+                   if line.startswith("--- File: ")]
+        assert headers == [f"--- File: mod_{i:03d}.py" for i in reversed(range(150))]
+
     def test_create_file_manifest(self, tmp_path):
         """Test file manifest creation."""
         # Create test files
@@ -411,6 +459,78 @@ class TestConcatenation:
         assert "bytes" in content
 
 
+class TestPythonOutline:
+    """Test suite for Python outline generation."""
+    
+    def test_analyze_module_level_symbols(self, tmp_path):
+        """Test that only module-level symbols are reported, in source order."""
+        source = tmp_path / "sample.py"
+        source.write_text(
+            "class Outer:\n"
+            "    class Inner:\n"
+            "        pass\n"
+            "    def method(self):\n"
+            "        def helper():\n"
+            "            pass\n"
+            "try:\n"
+            "    import json\n"
+            "except ImportError:\n"
+            "    def fallback():\n"
+            "        pass\n"
+            "async def main():\n"
+            "    pass\n"
+        )
+        
+        symbols = analyze_python_file(source)
+        
+        assert [s["name"] for s in symbols] == ["Outer", "fallback", "main"]
+        assert symbols[0]["nested_classes"][0]["name"] == "Inner"
+        assert [m["name"] for m in symbols[0]["methods"]] == ["method"]
+        assert symbols[2]["is_async"]
+    
+    def test_outline_cache_reuses_unchanged_files(self, tmp_path):
+        """Test that cached outlines are reused until the file changes."""
+        source = tmp_path / "sample.py"
+        source.write_text("def first():\n    pass\n")
+        file_list = [{"path": source, "relative_path": "sample.py", "type": "file"}]
+        
+        def outline():
+            output = tmp_path / "outline.txt"
+            output.write_text("")
+            assert python_outline_files(file_list, str(output), use_cache=True)
+            return output.read_text()
+        
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path / "cache")}):
+            first = outline()
+            with patch("flort.python_outline._cacheable_outline") as generate:
+                assert outline() == first
+                generate.assert_not_called()
+            
+            source.write_text("def second():\n    pass\n")
+            assert "second" in outline()
+    
+    def test_outline_cache_skips_failed_files(self, tmp_path):
+        """Test that unparsable and unreadable files are never served from the cache."""
+        unparsable = tmp_path / "broken.py"
+        unparsable.write_text("def f(:\n")
+        unreadable = tmp_path / "folder.py"
+        unreadable.mkdir()
+        output = tmp_path / "outline.txt"
+        
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path / "cache")}):
+            for source in (unparsable, unreadable):
+                file_list = [{"path": source, "relative_path": source.name, "type": "file"}]
+                for _ in range(2):
+                    output.write_text("")
+                    assert python_outline_files(file_list, str(output), use_cache=True)
+                    assert "ERROR:" in output.read_text()
+                
+                with patch("flort.python_outline._cacheable_outline",
+                           return_value=("regenerated", True)) as generate:
+                    assert python_outline_files(file_list, str(output), use_cache=True)
+                    generate.assert_called_once()
+
+
 class TestCLI:
     """Test suite for CLI functionality."""
     